@@ -49,29 +49,37 @@ class CreateSilhouetteCommand:
         
         created_count = 0
         
-        # Process each selected object
-        for obj in sel:
-            # Check if this is a Layout group
-            if is_layout_group(obj):
-                FreeCAD.Console.PrintMessage(f"Processing Layout: {obj.Label}\n")
-                silhouettes = create_silhouettes_for_layout(doc, obj)
-                created_count += len(silhouettes) if silhouettes else 0
+        # Record all new objects as one undo step instead of one per addObject
+        doc.openTransaction("Create Silhouette")
+        try:
+            # Process each selected object
+            for obj in sel:
+                # Check if this is a Layout group
+                if is_layout_group(obj):
+                    FreeCAD.Console.PrintMessage(f"Processing Layout: {obj.Label}\n")
+                    silhouettes = create_silhouettes_for_layout(doc, obj)
+                    created_count += len(silhouettes) if silhouettes else 0
                 
-            # Check if this is a nested container (App::Part like nested_Side_1)
-            elif is_nested_container(obj):
-                FreeCAD.Console.PrintMessage(f"Processing container: {obj.Label}\n")
-                silhouette = create_silhouette_for_container(doc, obj)
-                if silhouette:
-                    created_count += 1
+                # Check if this is a nested container (App::Part like nested_Side_1)
+                elif is_nested_container(obj):
+                    FreeCAD.Console.PrintMessage(f"Processing container: {obj.Label}\n")
+                    silhouette = create_silhouette_for_container(doc, obj)
+                    if silhouette:
+                        created_count += 1
                     
-            # Try as a direct part
-            elif hasattr(obj, "Shape") and not obj.Shape.isNull():
-                FreeCAD.Console.PrintMessage(f"Processing part: {obj.Label}\n")
-                silhouette = create_silhouette_for_part(doc, obj)
-                if silhouette:
-                    created_count += 1
-            else:
-                FreeCAD.Console.PrintWarning(f"Skipping '{obj.Label}': Not a valid shape\n")
+                # Try as a direct part
+                elif hasattr(obj, "Shape") and not obj.Shape.isNull():
+                    FreeCAD.Console.PrintMessage(f"Processing part: {obj.Label}\n")
+                    silhouette = create_silhouette_for_part(doc, obj)
+                    if silhouette:
+                        created_count += 1
+                else:
+                    FreeCAD.Console.PrintWarning(f"Skipping '{obj.Label}': Not a valid shape\n")
+        except Exception:
+            # Drop the partly created silhouettes instead of committing them
+            doc.abortTransaction()
+            raise
+        doc.commitTransaction()
         
         if created_count > 0:
             doc.recompute()
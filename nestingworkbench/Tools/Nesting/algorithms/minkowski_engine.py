@@ -6,6 +6,11 @@ from threading import Lock
 from shapely.geometry import Polygon, Point, MultiPoint
 from shapely.affinity import translate, rotate
 from shapely.ops import unary_union
+try:
+    # Shapely 2 interpolates a whole array of distances in one GEOS call
+    from shapely import line_interpolate_point
+except ImportError:
+    line_interpolate_point = None
 from . import minkowski_utils
 from ....datatypes.shape import Shape
 
@@ -233,7 +238,10 @@ class MinkowskiEngine:
         length = line.length
         if length > self.step_size:
             num_segments = int(length / self.step_size)
-            for i in range(1, num_segments):
-                points.append(line.interpolate(float(i) / num_segments, normalized=True))
+            fractions = [float(i) / num_segments for i in range(1, num_segments)]
+            if line_interpolate_point is not None:
+                points.extend(line_interpolate_point(line, fractions, normalized=True))
+            else:
+                points.extend(line.interpolate(f, normalized=True) for f in fractions)
         points.append(Point(line.coords[-1]))
         return points
@@ -5,11 +5,12 @@ import random
 import copy
 from datetime import datetime
 from collections import defaultdict
+from functools import lru_cache
 from concurrent.futures import ThreadPoolExecutor, as_completed
 from shapely.geometry import Polygon, Point
 
 from shapely.prepared import prep
-from shapely.affinity import rotate, translate
+from shapely.affinity import rotate
 
 import FreeCAD
 from ....datatypes.sheet import Sheet
@@ -17,6 +18,11 @@ from ....datatypes.placed_part import PlacedPart
 from . import genetic_utils
 from .minkowski_engine import MinkowskiEngine
 
+@lru_cache(maxsize=None)
+def _rotation_angles(rotation_steps):
+    """The trial angles for a rotation step count, computed once per count."""
+    return tuple(i * (360.0 / rotation_steps) for i in range(rotation_steps))
+
 class PlacementOptimizer:
     """
     Handles the geometric logic of finding the best position for a part on a sheet.
@@ -27,6 +33,13 @@ class PlacementOptimizer:
         self.search_direction = search_direction
         self.log_callback = log_callback
         self.trial_callback = trial_callback  # Called for each trial placement in simulation mode
+        self._rotation_pool = None # Created on first use, reused for every placement
+
+    def close(self):
+        """Shuts down the rotation evaluation pool."""
+        if self._rotation_pool is not None:
+            self._rotation_pool.shutdown(wait=False)
+            self._rotation_pool = None
 
     def log(self, message):
         if self.log_callback:
@@ -58,24 +71,25 @@ class PlacementOptimizer:
             part_rotation_steps = self.rotation_steps
         part_rotation_steps = max(1, part_rotation_steps)
         
-        # Parallel execution
-        with ThreadPoolExecutor() as executor:
-            angles = [i * (360.0 / part_rotation_steps) for i in range(part_rotation_steps)]
-            futures = {
-                executor.submit(self._evaluate_rotation, angle, part, placed_parts_grouped, sheet, direction): angle 
-                for angle in angles
-            }
-            
-            for future in as_completed(futures):
-                try:
-                    res = future.result()
-                    if res and res['metric'] < best_result['metric']:
-                        best_result = res
-                        # Call trial callback from main thread for each better result found
-                        if self.trial_callback and best_result.get('x') is not None:
-                            self.trial_callback(part, best_result['angle'], best_result['x'], best_result['y'])
-                except Exception as e:
-                    self.log(f"Error in rotation evaluation thread: {e}")
+        # Parallel execution on a pool kept for the whole run, not one per placement
+        if self._rotation_pool is None:
+            self._rotation_pool = ThreadPoolExecutor()
+        executor = self._rotation_pool
+        futures = {
+            executor.submit(self._evaluate_rotation, angle, part, placed_parts_grouped, sheet, direction): angle 
+            for angle in _rotation_angles(part_rotation_steps)
+        }
+        
+        for future in as_completed(futures):
+            try:
+                res = future.result()
+                if res and res['metric'] < best_result['metric']:
+                    best_result = res
+                    # Call trial callback from main thread for each better result found
+                    if self.trial_callback and best_result.get('x') is not None:
+                        self.trial_callback(part, best_result['angle'], best_result['x'], best_result['y'])
+            except Exception as e:
+                self.log(f"Error in rotation evaluation thread: {e}")
         
         if best_result.get('x') is not None:
              part.set_rotation(best_result['angle'], reposition=False)
@@ -92,8 +106,6 @@ class PlacementOptimizer:
         if nfp_entry is None:
             return {'metric': float('inf')}
         
-        bin_polygon = self.engine.bin_polygon
-        
         # Prepare geometry for fast containment check
         union_poly = nfp_entry['polygon']
         prepared_nfp = nfp_entry.get('prepared')
@@ -132,39 +144,32 @@ class PlacementOptimizer:
 
         # 3. Score Candidates
         centroid = rotated_poly.centroid
+        cx, cy = centroid.x, centroid.y
         dir_x, dir_y = direction
         
         best = {'metric': float('inf')}
-        valid_count = 0
-        rejected_nfp = 0
-        rejected_bounds = 0
-        
-        def score_point(pt):
-             nonlocal rejected_nfp, rejected_bounds
-             # A. Check NFP Collision (Fastest if cached)
-             if prepared_nfp and prepared_nfp.contains(pt): 
-                 rejected_nfp += 1
-                 return None
-                 
-             dx, dy = pt.x - centroid.x, pt.y - centroid.y
-             
-             # B. Check Bounds
-             test_poly = translate(rotated_poly, xoff=dx, yoff=dy)
-             if not bin_polygon.contains(test_poly):
-                 rejected_bounds += 1
-                 return None
+        best_metric = best['metric']
+
+        # The bin is an axis-aligned rectangle from (0, 0), so "part inside bin" reduces to
+        # comparing the translated part bounds against it; no polygon is built per candidate.
+        for pt in ext_cands:
+            px, py = pt.x, pt.y
+            metric = px * (-dir_x) + py * (-dir_y)
+            # Only candidates that would beat the current best need the geometric checks
+            if metric >= best_metric:
+                continue
 
-             return pt.x * (-dir_x) + pt.y * (-dir_y)
+            # A. Check Bounds
+            dx, dy = px - cx, py - cy
+            if min_x + dx < 0 or min_y + dy < 0 or max_x + dx > w_bin or max_y + dy > h_bin:
+                continue
 
-        # Sort candidates (heuristic optimization)
-        # ext_cands.sort(key=lambda p: p.x * (-dir_x) + p.y * (-dir_y))
+            # B. Check NFP Collision
+            if prepared_nfp and prepared_nfp.contains(pt):
+                continue
 
-        for pt in ext_cands:
-            valid_metric = score_point(pt)
-            if valid_metric is not None:
-                valid_count += 1
-                if valid_metric < best['metric']:
-                    best = {'x': pt.x, 'y': pt.y, 'angle': angle, 'metric': valid_metric}
+            best_metric = metric
+            best = {'x': px, 'y': py, 'angle': angle, 'metric': metric}
         
         return best
 
@@ -222,14 +227,16 @@ class Nester:
         NOTE: GA optimization is now handled at the controller level using LayoutManager.
         This method just runs standard greedy nesting.
         """
-        # Cleanup debug objects
+        self.remove_debug_objects()
+        return self._nest_standard(parts, sort=sort)
+
+    def remove_debug_objects(self):
+        """Removes the Minkowski debug object left in the document by earlier runs."""
         doc = FreeCAD.ActiveDocument
         if doc and doc.getObject("MinkowskiDebug"):
             doc.removeObject("MinkowskiDebug")
             doc.recompute()
 
-        return self._nest_standard(parts, sort=sort)
-
     def _nest_standard(self, parts, sort=True, quiet=None):
         """
         Standard greedy nesting strategy.
@@ -250,56 +257,59 @@ class Nester:
         unplaced_parts = []
         total_parts = len(current_parts)
         
-        for i, part in enumerate(current_parts):
-            if not quiet:
-                self.log(f"Processing part {i+1}/{total_parts}: {part.id}")
-                if self.progress_callback:
-                    self.progress_callback(i + 1, total_parts, f"Placing {part.id}...")
-            start_part_time = datetime.now()
-            placed = False
+        try:
+            for i, part in enumerate(current_parts):
+                if not quiet:
+                    self.log(f"Processing part {i+1}/{total_parts}: {part.id}")
+                    if self.progress_callback:
+                        self.progress_callback(i + 1, total_parts, f"Placing {part.id}...")
+                start_part_time = datetime.now()
+                placed = False
             
-            # Notify start of part placement (for highlighting master shapes)
-            if not quiet and self.part_start_callback:
-                self.part_start_callback(part)
+                # Notify start of part placement (for highlighting master shapes)
+                if not quiet and self.part_start_callback:
+                    self.part_start_callback(part)
             
-            # 1. Try existing sheets
-            for sheet_idx, sheet in enumerate(sheets):
-                if (sheet.width * sheet.height - sheet.used_area) < part.area: continue
+                # 1. Try existing sheets
+                for sheet_idx, sheet in enumerate(sheets):
+                    if (sheet.width * sheet.height - sheet.used_area) < part.area: continue
 
-                if self._attempt_placement_on_sheet(part, sheet):
-                    placed = True
-                    if not quiet:
-                        elapsed = (datetime.now() - start_part_time).total_seconds()
-                        self.log(f"  -> Placed on Sheet {sheet_idx+1} ({elapsed:.4f}s)")
-                        if self.update_callback: self.update_callback(part, sheet)
-                    break
+                    if self._attempt_placement_on_sheet(part, sheet):
+                        placed = True
+                        if not quiet:
+                            elapsed = (datetime.now() - start_part_time).total_seconds()
+                            self.log(f"  -> Placed on Sheet {sheet_idx+1} ({elapsed:.4f}s)")
+                            if self.update_callback: self.update_callback(part, sheet)
+                        break
             
-            # 2. Try new sheet
-            if not placed:
-                new_sheet = Sheet(len(sheets), self.bin_width, self.bin_height, spacing=self.spacing)
-                if self._attempt_placement_on_sheet(part, new_sheet):
-                    sheets.append(new_sheet)
-                    placed = True
-                    if not quiet:
-                        elapsed = (datetime.now() - start_part_time).total_seconds()
-                        self.log(f"  -> Placed on New Sheet {len(sheets)} ({elapsed:.4f}s)")
-                        if self.update_callback: self.update_callback(part, new_sheet)
-                else:
-                    unplaced_parts.append(part)
-                    if not quiet:
-                        self.log(f"  -> FAILED to place in {(datetime.now() - start_part_time).total_seconds():.4f}s")
+                # 2. Try new sheet
+                if not placed:
+                    new_sheet = Sheet(len(sheets), self.bin_width, self.bin_height, spacing=self.spacing)
+                    if self._attempt_placement_on_sheet(part, new_sheet):
+                        sheets.append(new_sheet)
+                        placed = True
+                        if not quiet:
+                            elapsed = (datetime.now() - start_part_time).total_seconds()
+                            self.log(f"  -> Placed on New Sheet {len(sheets)} ({elapsed:.4f}s)")
+                            if self.update_callback: self.update_callback(part, new_sheet)
+                    else:
+                        unplaced_parts.append(part)
+                        if not quiet:
+                            self.log(f"  -> FAILED to place in {(datetime.now() - start_part_time).total_seconds():.4f}s")
             
-            # Notify end of part placement (for unhighlighting master shapes)
-            if not quiet and self.part_end_callback:
-                self.part_end_callback(part, placed)
+                # Notify end of part placement (for unhighlighting master shapes)
+                if not quiet and self.part_end_callback:
+                    self.part_end_callback(part, placed)
             
-            # Submit background NFP pre-computation for remaining parts
-            if placed and i < total_parts - 1:
-                self._submit_precomputation(sheets, current_parts[i+1:])
-        
-        # Shut down precompute pool (don't wait for pending futures)
-        self._precompute_pool.shutdown(wait=False)
-        self._precomputed_keys.clear()
+                # Submit background NFP pre-computation for remaining parts
+                if placed and i < total_parts - 1:
+                    self._submit_precomputation(sheets, current_parts[i+1:])
+        finally:
+            # Shut down precompute pool (don't wait for pending futures), also
+            # when placement raised, so no pool threads are left behind
+            self._precompute_pool.shutdown(wait=False)
+            self.optimizer.close()
+            self._precomputed_keys.clear()
         return sheets, unplaced_parts
 
     def _attempt_placement_on_sheet(self, part, sheet):
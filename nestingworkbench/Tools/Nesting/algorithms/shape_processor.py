@@ -67,7 +67,11 @@ def get_2d_profile_from_obj(obj, up_direction="Z+", tessellation_quality=0.1, si
                 if len(pts) > 2:
                      from shapely.geometry import Polygon as ShapelyPolygon
                      if pts[0] != pts[-1]: pts.append(pts[0])
-                     return ShapelyPolygon(pts)
+                     poly = ShapelyPolygon(pts)
+                     # The 0.01mm discretization is very dense, so reduce it like the other paths do
+                     if simplification > 0:
+                         poly = poly.simplify(simplification, preserve_topology=True)
+                     return poly
             except Exception as e:
                 FreeCAD.Console.PrintWarning(f"Could not convert sketch '{obj.Label}' to polygon: {e}\n")
         
@@ -6,15 +6,56 @@ import os
 import time
 import math
 from PySide import QtGui
-from ...datatypes.shape import Shape
-from .shape_preparer import ShapePreparer
-from .layout_manager import LayoutManager, Layout
 from ...freecad_helpers import recursive_delete
 
-try:
-    from .nesting_logic import nest, NestingDependencyError
-except ImportError:
-    pass
+# Label conventions for objects created by the nesting job.
+_MASTER_SHAPE_PREFIX = "master_shape_"
+_MASTER_SHAPES_GROUP = "MasterShapes"
+_LAYOUT_PREFIX = "Layout_"
+_SHEET_PREFIX = "Sheet_"
+
+# Exact TypeId matches answered before falling back to substring checks in _is_assembly
+_ASSEMBLY_TYPEIDS = frozenset({'Assembly::AssemblyObject', 'Assembly::AssemblyLink'})
+_LINK_TYPEIDS = frozenset({'App::Link', 'App::LinkElement', 'App::LinkGroup'})
+_PLAIN_PART_TYPEIDS = frozenset({
+    'Part::Feature', 'PartDesign::Body', 'Sketcher::SketchObject',
+    'Part::Extrusion', 'Part::Box', 'Part::Cylinder', 'Mesh::Feature',
+})
+
+# Verbose load-path logging; set NESTING_DEBUG=1 in the environment to enable
+_DEBUG = os.environ.get("NESTING_DEBUG", "") == "1"
+
+def _display_label(label):
+    """The label shown in the parts table: master shape labels lose their prefix."""
+    return label[len(_MASTER_SHAPE_PREFIX):] if label.startswith(_MASTER_SHAPE_PREFIX) else label
+
+# Layout font files already found on disk. Only hits are remembered, so a font
+# on a share that was briefly unreachable is found again on the next load.
+_existing_font_files = set()
+
+def _font_file_exists(path):
+    """os.path.exists for layout font files, remembering the paths that exist."""
+    if path in _existing_font_files:
+        return True
+    if os.path.exists(path):
+        _existing_font_files.add(path)
+        return True
+    return False
+
+_PREFS_PATH = "User parameter:BaseApp/Preferences/NestingWorkbench"
+
+# Layout group properties restored into panel widgets by load_layout: (property, widget attribute)
+_LAYOUT_WIDGET_SETTINGS = (
+    ("SheetWidth", "sheet_width_input"),
+    ("SheetHeight", "sheet_height_input"),
+    ("PartSpacing", "part_spacing_input"),
+    ("SheetThickness", "sheet_thickness_input"),
+    ("DeflectionAngle", "deflection_input"),
+    ("Simplification", "simplification_input"),
+    ("LabelSize", "label_size_input"),
+    ("Generations", "minkowski_generations_input"),
+    ("PopulationSize", "minkowski_population_size_input"),
+)
 
 class NestingJob:
     """
@@ -73,7 +114,8 @@ class NestingJob:
         # 1.5 Persist Metadata (Quantity, Rotations) to Master Containers
         self._persist_metadata(quantities, rotation_params)
 
-        # 2. Run Algorithm
+        # 2. Run Algorithm (the nesting engine is only imported once a job actually runs)
+        from .nesting_logic import nest
         self.sheets, unplaced, steps = nest(
             parts_to_nest, 
             self.params['sheet_width'], 
@@ -99,16 +141,16 @@ class NestingJob:
         return len(self.sheets), sum(len(s) for s in self.sheets)
 
     def _persist_metadata(self, quantities, rotation_params):
-        master_group = self.temp_layout.getObject("MasterShapes")
+        master_group = self.temp_layout.getObject(_MASTER_SHAPES_GROUP)
         if not master_group: return
         
         for container in master_group.Group:
              if not hasattr(container, "Group"): continue
              
              # Find inner shape label
-             shape = next((c for c in container.Group if c.Label.startswith("master_shape_")), None)
+             shape = next((c for c in container.Group if c.Label.startswith(_MASTER_SHAPE_PREFIX)), None)
              if shape:
-                 original_label = shape.Label.replace("master_shape_", "")
+                 original_label = shape.Label.replace(_MASTER_SHAPE_PREFIX, "")
                  
                  # Save Quantity
                  # quantities dict is {label: (qty, rotation_steps)}
@@ -140,23 +182,23 @@ class NestingJob:
         # Current logic: If we re-ran, we overwrite sheets.
         to_remove = []
         for child in self.target_layout.Group:
-            if child.Label.startswith("Sheet_"):
+            if child.Label.startswith(_SHEET_PREFIX):
                 to_remove.append(child)
         
         for child in to_remove:
             recursive_delete(self.doc, child)
             
         # 2. Check for new MasterShapes in Temp
-        temp_masters = next((c for c in self.temp_layout.Group if c.Label.startswith("MasterShapes")), None)
+        temp_masters = next((c for c in self.temp_layout.Group if c.Label.startswith(_MASTER_SHAPES_GROUP)), None)
         
         if temp_masters and len(temp_masters.Group) > 0:
             # We have new masters, replace old ones in Target
-            old_masters = next((c for c in self.target_layout.Group if c.Label.startswith("MasterShapes")), None)
+            old_masters = next((c for c in self.target_layout.Group if c.Label.startswith(_MASTER_SHAPES_GROUP)), None)
             if old_masters:
                 recursive_delete(self.doc, old_masters)
             
             # Sanitize labels before move
-            temp_masters.Label = "MasterShapes"
+            temp_masters.Label = _MASTER_SHAPES_GROUP
             for m in temp_masters.Group:
                 if m.Label.startswith("temp_master_"):
                     m.Label = m.Label.replace("temp_master_", "master_")
@@ -169,7 +211,7 @@ class NestingJob:
                 recursive_delete(self.doc, temp_masters)
 
         # 3. Move Sheets from Temp to Target
-        sheets_to_move = [c for c in self.temp_layout.Group if c.Label.startswith("Sheet_")]
+        sheets_to_move = [c for c in self.temp_layout.Group if c.Label.startswith(_SHEET_PREFIX)]
         for sheet in sheets_to_move:
             self.target_layout.addObject(sheet)
             
@@ -245,14 +287,17 @@ class NestingController:
         self.ui = ui_panel
         self.doc = FreeCAD.ActiveDocument
         self.current_job = None
-        self.shape_preparer = ShapePreparer(self.doc, {})
-        
-        # Initialize default fonts
-        font_dir = os.path.abspath(os.path.join(os.path.dirname(__file__), '..', '..', '..', 'fonts'))
-        default_font = os.path.join(font_dir, 'PoiretOne-Regular.ttf')
-        self.ui.selected_font_path = default_font
-        if hasattr(self.ui, 'font_label'):
-            self.ui.font_label.setText(os.path.basename(default_font))
+        self._shape_preparer = None
+        self._known_labels = set() # Labels shown in the parts table, kept in step with its rows
+        # The default font is preselected by the panel itself (NestingPanel.set_default_font)
+
+    @property
+    def shape_preparer(self):
+        """The ShapePreparer, created with the first job so loading a selection stays light."""
+        if self._shape_preparer is None:
+            from .shape_preparer import ShapePreparer
+            self._shape_preparer = ShapePreparer(self.doc, {})
+        return self._shape_preparer
 
     def execute_nesting(self):
         FreeCAD.Console.PrintMessage("\n--- NESTING START ---\n")
@@ -262,6 +307,7 @@ class NestingController:
             self.current_job = None
 
         # Clear stale caches from previous nesting runs
+        from ...datatypes.shape import Shape
         Shape.clear_caches()
 
         # 1. Ensure Target Layout Exists (Create default if needed)
@@ -290,31 +336,36 @@ class NestingController:
         self.ui.reset_progress()
         algo_kwargs['progress_callback'] = progress_cb
         
+        # Progress updates process pending events during the run, so lock every
+        # panel action that would start another job or change the parts it uses
+        self.ui.set_job_running(True)
         try:
             self._execute_ga_nesting(target_layout, ui_params, quantities, master_map, 
                                      rotation_params, algo_kwargs, is_simulating)
         finally:
             # Ensure progress bar is reset on finish/error
             self.ui.reset_progress()
+            self.ui.set_job_running(False)
     
     def load_selection(self):
-        FreeCAD.Console.PrintMessage("Loading selection via Controller...\n")
+        if _DEBUG: FreeCAD.Console.PrintMessage("Loading selection via Controller...\n")
         selection = FreeCADGui.Selection.getSelection()
         self.ui.shape_table.setRowCount(0)
+        self._known_labels.clear()
 
         if not selection:
-            FreeCAD.Console.PrintMessage("  -> No selection found.\n")
+            if _DEBUG: FreeCAD.Console.PrintMessage("  -> No selection found.\n")
             self.ui.status_label.setText("Warning: No shapes selected.")
             self.ui.nest_button.setEnabled(False)
             return
 
         # Check if a layout group is selected
         first_selected = selection[0]
-        if first_selected.isDerivedFrom("App::DocumentObjectGroup") and first_selected.Label.startswith("Layout_"):
-            FreeCAD.Console.PrintMessage(f"  -> Detected layout selection: {first_selected.Label}\n")
+        if first_selected.isDerivedFrom("App::DocumentObjectGroup") and first_selected.Label.startswith(_LAYOUT_PREFIX):
+            if _DEBUG: FreeCAD.Console.PrintMessage(f"  -> Detected layout selection: {first_selected.Label}\n")
             self.load_layout(first_selected)
         else:
-            FreeCAD.Console.PrintMessage(f"  -> Detected {len(selection)} shapes.\n")
+            if _DEBUG: FreeCAD.Console.PrintMessage(f"  -> Detected {len(selection)} shapes.\n")
             self.load_shapes(selection)
 
     def load_layout(self, layout_group):
@@ -325,39 +376,25 @@ class NestingController:
         self.ui.hidden_originals = []
 
         # Read parameters directly from the layout group's properties
-        if hasattr(layout_group, 'SheetWidth'):
-            self.ui.sheet_width_input.setValue(layout_group.SheetWidth)
-        if hasattr(layout_group, 'SheetHeight'):
-            self.ui.sheet_height_input.setValue(layout_group.SheetHeight)
-        if hasattr(layout_group, 'PartSpacing'):
-            self.ui.part_spacing_input.setValue(layout_group.PartSpacing)
-        if hasattr(layout_group, 'SheetThickness'):
-            self.ui.sheet_thickness_input.setValue(layout_group.SheetThickness)
-        
-        # Load deflection angle (new format) or convert old deflection mm to angle
-        if hasattr(layout_group, 'DeflectionAngle'):
-            self.ui.deflection_input.setValue(layout_group.DeflectionAngle)
-        elif hasattr(layout_group, 'Deflection'):
-            # Backward compatibility: convert old Deflection (mm) to angle
-            deflection_angle = layout_group.Deflection * 200.0
-            self.ui.deflection_input.setValue(deflection_angle)
-            
-        if hasattr(layout_group, 'Simplification'):
-            self.ui.simplification_input.setValue(layout_group.Simplification)
-        if hasattr(layout_group, 'FontFile') and os.path.exists(layout_group.FontFile):
-            self.ui.selected_font_path = layout_group.FontFile
-            self.ui.font_label.setText(os.path.basename(layout_group.FontFile))
-        if hasattr(layout_group, 'LabelSize'):
-            self.ui.label_size_input.setValue(layout_group.LabelSize)
-        if hasattr(layout_group, 'Generations'):
-            self.ui.minkowski_generations_input.setValue(layout_group.Generations)
-        if hasattr(layout_group, 'PopulationSize'):
-            self.ui.minkowski_population_size_input.setValue(layout_group.PopulationSize)
+        ui = self.ui
+        for prop, widget_name in _LAYOUT_WIDGET_SETTINGS:
+            value = getattr(layout_group, prop, None)
+            if value is not None:
+                getattr(ui, widget_name).setValue(value)
+
+        # Backward compatibility: convert old Deflection (mm) to angle
+        if not hasattr(layout_group, 'DeflectionAngle') and hasattr(layout_group, 'Deflection'):
+            ui.deflection_input.setValue(layout_group.Deflection * 200.0)
+
+        font_file = getattr(layout_group, 'FontFile', None)
+        if font_file and _font_file_exists(font_file):
+            ui.selected_font_path = font_file
+            ui.font_label.setText(os.path.basename(font_file))
 
         # Get the shapes from the layout
         master_shapes_group = None
         for child in layout_group.Group:
-            if child.Label.startswith("MasterShapes"):
+            if child.Label.startswith(_MASTER_SHAPES_GROUP):
                 master_shapes_group = child
                 break
         
@@ -372,25 +409,33 @@ class NestingController:
             up_directions = {}
             fill_sheet_map = {}
             
+            shape_prefix = _MASTER_SHAPE_PREFIX
             for master_container in master_shapes_group.Group:
                 # Use a relaxed check for the container to ensure robust loading.
-                if hasattr(master_container, "Group"):
-                    # The object to load is the 'master_shape_...' object inside the container.
-                    shape_obj = next((child for child in master_container.Group if child.Label.startswith("master_shape_")), None)
-                    if shape_obj and hasattr(shape_obj, "Shape"):
-                        shapes_to_load.append(shape_obj)
-                        
-                        # Recover properties from container
-                        quantities[shape_obj.Label] = getattr(master_container, "Quantity", 1)
-                        
-                        if hasattr(master_container, "PartRotationOverride"):
-                            rotation_overrides[shape_obj.Label] = master_container.PartRotationOverride
-                        if hasattr(master_container, "PartRotationSteps"):
-                            rotation_steps_map[shape_obj.Label] = master_container.PartRotationSteps
-                        if hasattr(master_container, "UpDirection"):
-                            up_directions[shape_obj.Label] = master_container.UpDirection
-                        if hasattr(master_container, "FillSheet"):
-                            fill_sheet_map[shape_obj.Label] = master_container.FillSheet
+                if not hasattr(master_container, "Group"):
+                    continue
+                # The object to load is the 'master_shape_...' object inside the container.
+                # Containers normally hold only the shape, so probe the first entry before scanning.
+                children = master_container.Group
+                shape_obj = None
+                if children and children[0].Label.startswith(shape_prefix):
+                    shape_obj = children[0]
+                else:
+                    for child in children:
+                        if child.Label.startswith(shape_prefix):
+                            shape_obj = child
+                            break
+                if shape_obj is None or not hasattr(shape_obj, "Shape"):
+                    continue
+
+                # Recover properties from container (defaults match load_shapes)
+                label = shape_obj.Label
+                shapes_to_load.append(shape_obj)
+                quantities[label] = getattr(master_container, "Quantity", 1)
+                rotation_overrides[label] = getattr(master_container, "PartRotationOverride", False)
+                rotation_steps_map[label] = getattr(master_container, "PartRotationSteps", 4)
+                up_directions[label] = getattr(master_container, "UpDirection", "Z+")
+                fill_sheet_map[label] = getattr(master_container, "FillSheet", False)
             
             self.load_shapes(
                 shapes_to_load, 
@@ -404,50 +449,60 @@ class NestingController:
             
             # Load Global Rotation Steps if present
             if hasattr(layout_group, "GlobalRotationSteps"):
-                self.ui.rotation_steps_spinbox.setValue(layout_group.GlobalRotationSteps)
+                # Set both halves of the pair directly instead of letting them echo each other
+                for widget in (self.ui.rotation_steps_spinbox, self.ui.rotation_steps_slider):
+                    was_blocked = widget.blockSignals(True)
+                    widget.setValue(layout_group.GlobalRotationSteps)
+                    widget.blockSignals(was_blocked)
         else:
             FreeCAD.Console.PrintMessage(f"  WARNING: No MasterShapes group found!\n")
             self.ui.status_label.setText("Warning: Could not find 'MasterShapes' group in the selected layout.")
 
+    @staticmethod
+    def _is_assembly(obj):
+        """Check if object is an Assembly container (not a regular Part/Body)."""
+        type_id = getattr(obj, 'TypeId', '')
+        if type_id in _PLAIN_PART_TYPEIDS:
+            return False
+        if type_id in _ASSEMBLY_TYPEIDS or 'Assembly' in type_id:
+            return True
+        if type_id == 'App::Part' and hasattr(obj, 'Group'):
+            for child in obj.Group:
+                child_type = getattr(child, 'TypeId', '')
+                if child_type in _LINK_TYPEIDS or 'Link' in child_type or 'Assembly' in child_type:
+                    return True
+        return False
+
+    def _extract_from_assembly(self, assembly):
+        """Collects nestable parts from an assembly, walking sub-assemblies with an explicit stack."""
+        parts = []
+        # Children are pushed in reverse so they are visited in tree order
+        stack = list(reversed(getattr(assembly, 'Group', ())))
+        while stack:
+            child = stack.pop()
+            child_type = getattr(child, 'TypeId', '')
+            if 'Constraint' in child_type or 'Origin' in child_type:
+                continue
+            linked = getattr(child, 'LinkedObject', None)
+            if linked:
+                if hasattr(linked, 'Shape') and linked.Shape and not linked.Shape.isNull():
+                    parts.append(linked)
+            elif hasattr(child, 'Shape') and child.Shape and not child.Shape.isNull():
+                if self._is_assembly(child):
+                    stack.extend(reversed(getattr(child, 'Group', ())))
+                else:
+                    parts.append(child)
+        return parts
+
     def _extract_parts_from_selection(self, selection):
         """
         Extracts parts from Assembly containers only.
         Regular Part objects are used directly without extracting children.
         """
         parts = []
-        
-        def is_assembly(obj):
-            """Check if object is an Assembly container (not a regular Part/Body)."""
-            type_id = obj.TypeId if hasattr(obj, 'TypeId') else ''
-            if 'Assembly' in type_id:
-                return True
-            if type_id == 'App::Part' and hasattr(obj, 'Group'):
-                for child in obj.Group:
-                    child_type = child.TypeId if hasattr(child, 'TypeId') else ''
-                    if 'Link' in child_type or 'Assembly' in child_type:
-                        return True
-            return False
-        
-        def extract_from_assembly(obj):
-            """Recursively extract nestable parts from an assembly."""
-            if hasattr(obj, 'Group'):
-                for child in obj.Group:
-                    child_type = child.TypeId if hasattr(child, 'TypeId') else ''
-                    if 'Constraint' in child_type or 'Origin' in child_type:
-                        continue
-                    if hasattr(child, 'LinkedObject') and child.LinkedObject:
-                        linked = child.LinkedObject
-                        if hasattr(linked, 'Shape') and linked.Shape and not linked.Shape.isNull():
-                            parts.append(linked)
-                    elif hasattr(child, 'Shape') and child.Shape and not child.Shape.isNull():
-                        if is_assembly(child):
-                            extract_from_assembly(child)
-                        else:
-                            parts.append(child)
-        
         for obj in selection:
-            if is_assembly(obj):
-                extract_from_assembly(obj)
+            if self._is_assembly(obj):
+                parts.extend(self._extract_from_assembly(obj))
             else:
                 parts.append(obj)
         
@@ -474,55 +529,61 @@ class NestingController:
                         selection_counts[obj] = 1
                 
                 selection = extracted
-                FreeCAD.Console.PrintMessage(f"  -> Extracted {len(selection)} parts from selection.\n")
+                if _DEBUG: FreeCAD.Console.PrintMessage(f"  -> Extracted {len(selection)} parts from selection.\n")
         
-        # Keep unique, preserve order
-        self.ui.selected_shapes_to_process = list(dict.fromkeys(selection)) 
+        # Keep unique, preserve order; one pass, compared by identity
+        seen = set()
+        self.ui.selected_shapes_to_process = [obj for obj in selection
+                                              if not (id(obj) in seen or seen.add(id(obj)))]
         
         if not is_reloading_layout:
             self.ui.current_layout = None
-            self.ui.hidden_originals = list(self.ui.selected_shapes_to_process)
+            # Resolve the view objects now so reject() can restore them without lookups
+            self.ui.hidden_originals = [vo for vo in (getattr(obj, "ViewObject", None)
+                                                      for obj in self.ui.selected_shapes_to_process) if vo]
         
-        self.ui.shape_table.setRowCount(len(self.ui.selected_shapes_to_process))
-        for i, obj in enumerate(self.ui.selected_shapes_to_process):
-            # Clean up label if it's a master shape
-            display_label = obj.Label
-            if display_label.startswith("master_shape_"):
-                display_label = display_label.replace("master_shape_", "")
+        known_labels = self._known_labels = set()
+        with self.ui.batch_table_update():
+            self.ui.shape_table.setRowCount(len(self.ui.selected_shapes_to_process))
+            for i, obj in enumerate(self.ui.selected_shapes_to_process):
+                # Clean up label if it's a master shape
+                label = obj.Label
+                display_label = _display_label(label)
+                known_labels.add(display_label)
             
-            # Default to 1, or use selection count if available
-            qty = selection_counts.get(obj, 1)
+                # Default to 1, or use selection count if available
+                qty = selection_counts.get(obj, 1)
             
-            # Allow initial_quantities to override (e.g. from saved layout)
-            if initial_quantities and obj.Label in initial_quantities:
-                qty = initial_quantities[obj.Label]
+                # Allow initial_quantities to override (e.g. from saved layout)
+                if initial_quantities and label in initial_quantities:
+                    qty = initial_quantities[label]
                 
-            steps = 4
-            override = False
-            if initial_rotation_steps and obj.Label in initial_rotation_steps:
-                steps = initial_rotation_steps[obj.Label]
-            if initial_overrides and obj.Label in initial_overrides:
-                override = initial_overrides[obj.Label]
+                steps = 4
+                override = False
+                if initial_rotation_steps and label in initial_rotation_steps:
+                    steps = initial_rotation_steps[label]
+                if initial_overrides and label in initial_overrides:
+                    override = initial_overrides[label]
             
-            up_dir = "Z+"
-            if initial_up_directions and obj.Label in initial_up_directions:
-                up_dir = initial_up_directions[obj.Label]
+                up_dir = "Z+"
+                if initial_up_directions and label in initial_up_directions:
+                    up_dir = initial_up_directions[label]
                 
-            fill = False
-            if initial_fill_sheet and obj.Label in initial_fill_sheet:
-                fill = initial_fill_sheet[obj.Label]
-
-            # We assume _add_part_row is still on UI or moved to a public method on UI
-            # Plan says it stays on UI but exposed. Let's assume it's publicly accessible as add_part_row now.
-            if hasattr(self.ui, 'add_part_row'):
-                 self.ui.add_part_row(i, display_label, quantity=qty, rotation_steps=steps, 
-                                      override_rotation=override, up_direction=up_dir, fill_sheet=fill)
-            elif hasattr(self.ui, '_add_part_row'):
-                 # Fallback if I haven't renamed it yet (I should rename it in next step)
-                 self.ui._add_part_row(i, display_label, quantity=qty, rotation_steps=steps, 
-                                      override_rotation=override, up_direction=up_dir, fill_sheet=fill)
+                fill = False
+                if initial_fill_sheet and label in initial_fill_sheet:
+                    fill = initial_fill_sheet[label]
+
+                # We assume _add_part_row is still on UI or moved to a public method on UI
+                # Plan says it stays on UI but exposed. Let's assume it's publicly accessible as add_part_row now.
+                if hasattr(self.ui, 'add_part_row'):
+                     self.ui.add_part_row(i, display_label, quantity=qty, rotation_steps=steps, 
+                                          override_rotation=override, up_direction=up_dir, fill_sheet=fill)
+                elif hasattr(self.ui, '_add_part_row'):
+                     # Fallback if I haven't renamed it yet (I should rename it in next step)
+                     self.ui._add_part_row(i, display_label, quantity=qty, rotation_steps=steps, 
+                                          override_rotation=override, up_direction=up_dir, fill_sheet=fill)
         
-        self.ui.shape_table.resizeColumnsToContents()
+        self.ui.schedule_table_resize()
         self.ui.status_label.setText(f"{len(selection)} unique object(s) selected. Specify quantities and nest.")
 
     def add_selected_shapes(self):
@@ -540,30 +601,28 @@ class NestingController:
                 selection_counts[obj] = selection_counts.get(obj, 0) + 1
             selection = extracted
 
-        existing_labels = [self.ui.shape_table.item(row, 0).text() for row in range(self.ui.shape_table.rowCount())]
-        
-        added_count = 0
-        
-        # Process unique objects from selection
-        unique_selection = list(dict.fromkeys(selection))
-        
-        for obj in unique_selection:
-            if obj.Label not in existing_labels:
-                row_position = self.ui.shape_table.rowCount()
-                self.ui.shape_table.insertRow(row_position)
-                
+        # Dedup by object first, then skip only labels already in the table before
+        # this call; distinct objects sharing a label are all added
+        existing_labels = self._known_labels
+        new_objects = [obj for obj in dict.fromkeys(selection) if obj.Label not in existing_labels]
+        existing_labels.update(obj.Label for obj in new_objects)
+        added_count = len(new_objects)
+
+        # Grow the table once, then fill the new rows
+        first_row = self.ui.shape_table.rowCount()
+        with self.ui.batch_table_update():
+            self.ui.shape_table.setRowCount(first_row + added_count)
+            for row_position, obj in enumerate(new_objects, first_row):
                 # Determine quantity from selection count
                 qty = selection_counts.get(obj, 1)
-                
+            
                 if hasattr(self.ui, 'add_part_row'):
                     self.ui.add_part_row(row_position, obj.Label, quantity=qty)
                 elif hasattr(self.ui, '_add_part_row'):
                     self.ui._add_part_row(row_position, obj.Label, quantity=qty)
-                    
-                self.ui.selected_shapes_to_process.append(obj)
-                added_count += 1
+        self.ui.selected_shapes_to_process.extend(new_objects)
         
-        self.ui.shape_table.resizeColumnsToContents()
+        self.ui.schedule_table_resize()
         self.ui.status_label.setText(f"Added {added_count} new shape(s).")
 
         # Enable the nest button if any shapes are now in the table
@@ -573,11 +632,23 @@ class NestingController:
     def remove_selected_shapes(self):
         """Removes the selected rows from the shape table."""
         selected_items = self.ui.shape_table.selectedItems()
-        selected_rows = sorted(list(set(item.row() for item in selected_items)), reverse=True)
-        for row in selected_rows:
-            label_to_remove = self.ui.shape_table.item(row, 0).text()
-            self.ui.selected_shapes_to_process = [obj for obj in self.ui.selected_shapes_to_process if obj.Label != label_to_remove]
-            self.ui.shape_table.removeRow(row)
+        selected_rows = sorted({item.row() for item in selected_items}, reverse=True)
+        labels_to_remove = {self.ui.shape_table.item(row, 0).text() for row in selected_rows}
+        # Remove contiguous runs of rows with one model call each, bottom-up so indices stay valid
+        model = self.ui.shape_table.model()
+        with self.ui.batch_table_update():
+            i = 0
+            while i < len(selected_rows):
+                last = first = selected_rows[i]
+                i += 1
+                while i < len(selected_rows) and selected_rows[i] == first - 1:
+                    first = selected_rows[i]
+                    i += 1
+                model.removeRows(first, last - first + 1)
+        # Table labels are display labels, so compare against those (master shapes are prefixed)
+        self.ui.selected_shapes_to_process = [obj for obj in self.ui.selected_shapes_to_process
+                                              if _display_label(obj.Label) not in labels_to_remove]
+        self._known_labels -= labels_to_remove
         self.ui.status_label.setText(f"Removed {len(selected_rows)} shape(s).")
 
         # Disable the nest button if the table is now empty
@@ -591,6 +662,7 @@ class NestingController:
                             rotation_params, algo_kwargs, is_simulating):
         """GA optimization using multiple layouts."""
         from .algorithms import genetic_utils
+        from .nesting_logic import nest
         
         generations = algo_kwargs.get('generations', 1)
         population_size = algo_kwargs.get('population_size', 1)
@@ -602,6 +674,7 @@ class NestingController:
         FreeCAD.Console.PrintMessage(f"GA Mode: {generations} generations, {population_size} population\n")
         
         # Create LayoutManager
+        from .layout_manager import LayoutManager
         layout_manager = LayoutManager(self.doc, self.shape_preparer.processed_shape_cache)
         
         # STEP 1: Create initial population of layouts
@@ -619,15 +692,16 @@ class NestingController:
         
         try:
             for gen in range(generations):
-                FreeCAD.Console.PrintMessage(f"\n=== Generation {gen+1}/{generations} ===\n")
                 self.ui.status_label.setText(f"Generation {gen+1}/{generations}...")
                 QtGui.QApplication.processEvents()
                 
-                # Debug: show all layouts with their part counts
-                FreeCAD.Console.PrintMessage(f"  Layouts to evaluate: {len(layouts)}\n")
+                # Debug: show all layouts with their part counts, written to the console in one call
+                lines = [f"\n=== Generation {gen+1}/{generations} ===", f"  Layouts to evaluate: {len(layouts)}"]
                 for i, lay in enumerate(layouts):
                     part_ids = [p.id for p in lay.parts] if lay.parts else []
-                    FreeCAD.Console.PrintMessage(f"    {i+1}. {lay.name}: {part_ids}\n")
+                    lines.append(f"    {i+1}. {lay.name}: {part_ids}")
+                lines.append("")
+                FreeCAD.Console.PrintMessage("\n".join(lines))
                 
                 # Run nesting on each layout
                 for idx, layout in enumerate(layouts):
@@ -775,7 +849,7 @@ class NestingController:
                 # Hide MasterShapes group to keep view clean
                 if best_layout.layout_group and hasattr(best_layout.layout_group, "Group"):
                     for child in best_layout.layout_group.Group:
-                        if child.Label.startswith("MasterShapes") and hasattr(child, "ViewObject"):
+                        if child.Label.startswith(_MASTER_SHAPES_GROUP) and hasattr(child, "ViewObject"):
                             child.ViewObject.Visibility = False
                 
                 best_layout.layout_group.Label = "Layout_temp"
@@ -826,9 +900,9 @@ class NestingController:
                 
             if final_layout and hasattr(final_layout, "Group"):
                 for child in final_layout.Group:
-                    if child.Label.startswith("MasterShapes") and hasattr(child, "ViewObject"):
+                    if child.Label.startswith(_MASTER_SHAPES_GROUP) and hasattr(child, "ViewObject"):
                         child.ViewObject.Visibility = False
-                    elif child.Label.startswith("Sheet_") and hasattr(child, "ViewObject"):
+                    elif child.Label.startswith(_SHEET_PREFIX) and hasattr(child, "ViewObject"):
                         child.ViewObject.Visibility = True
             
             self.current_job = None
@@ -849,7 +923,7 @@ class NestingController:
                 try: 
                     # Check if target layout is empty (newly created, never committed to)
                     has_content = any(
-                        child.Label.startswith("Sheet_") or child.Label.startswith("MasterShapes")
+                        child.Label.startswith(_SHEET_PREFIX) or child.Label.startswith(_MASTER_SHAPES_GROUP)
                         for child in (target.Group if hasattr(target, "Group") else [])
                     )
                     
@@ -867,10 +941,10 @@ class NestingController:
                         if hasattr(target, "Group"):
                             for child in target.Group:
                                 # Show Sheets
-                                if child.Label.startswith("Sheet_") and hasattr(child, "ViewObject"):
+                                if child.Label.startswith(_SHEET_PREFIX) and hasattr(child, "ViewObject"):
                                     child.ViewObject.Visibility = True
                                 # Hide MasterShapes
-                                if child.Label.startswith("MasterShapes") and hasattr(child, "ViewObject"):
+                                if child.Label.startswith(_MASTER_SHAPES_GROUP) and hasattr(child, "ViewObject"):
                                     child.ViewObject.Visibility = False
                 except Exception: pass
             
@@ -977,21 +1051,32 @@ class NestingController:
         return settings_dict
 
     def save_settings(self, settings):
-        """Saves current UI settings to FreeCAD preferences."""
-        prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/NestingWorkbench")
-        prefs.SetFloat("SheetWidth", float(settings['sheet_width']))
-        prefs.SetFloat("SheetHeight", float(settings['sheet_height']))
-        prefs.SetFloat("PartSpacing", float(settings['spacing']))
-        prefs.SetFloat("SheetThickness", float(settings['sheet_thickness']))
-        prefs.SetFloat("DeflectionAngle", float(settings.get('deflection_angle', 10)))  # Save angle, not mm
-        prefs.SetFloat("Simplification", float(settings['simplification']))
-        prefs.SetInt("RotationSteps", int(settings['rotation_steps']))
-        prefs.SetBool("AddLabels", bool(settings['add_labels']))
-        prefs.SetBool("ShowBounds", bool(settings['show_bounds']))
-        prefs.SetFloat("LabelHeight", float(settings['label_height']))
-        prefs.SetFloat("LabelSize", float(settings['label_size']))
+        """Saves current UI settings to FreeCAD preferences, skipping values that haven't changed."""
+        values = {
+            "SheetWidth": ("SetFloat", float(settings['sheet_width'])),
+            "SheetHeight": ("SetFloat", float(settings['sheet_height'])),
+            "PartSpacing": ("SetFloat", float(settings['spacing'])),
+            "SheetThickness": ("SetFloat", float(settings['sheet_thickness'])),
+            "DeflectionAngle": ("SetFloat", float(settings.get('deflection_angle', 10))),  # Save angle, not mm
+            "Simplification": ("SetFloat", float(settings['simplification'])),
+            "RotationSteps": ("SetInt", int(settings['rotation_steps'])),
+            "AddLabels": ("SetBool", bool(settings['add_labels'])),
+            "ShowBounds": ("SetBool", bool(settings['show_bounds'])),
+            "LabelHeight": ("SetFloat", float(settings['label_height'])),
+            "LabelSize": ("SetFloat", float(settings['label_size'])),
+        }
         if settings['font_path']:
-             prefs.SetString("FontPath", str(settings['font_path']))
+            values["FontPath"] = ("SetString", str(settings['font_path']))
+
+        saved = self.ui.persisted_settings
+        dirty = {key: v for key, v in values.items() if saved.get(key) != v[1]}
+        if not dirty:
+            return
+
+        prefs = FreeCAD.ParamGet(_PREFS_PATH)
+        for key, (setter, value) in dirty.items():
+            getattr(prefs, setter)(key, value)
+            saved[key] = value
 
     def _collect_job_parameters(self, ui_settings):
         # Re-implementation of collecting quantities and master map from UI table
@@ -1003,19 +1088,7 @@ class NestingController:
         
         for row in range(self.ui.shape_table.rowCount()):
             try:
-                label = self.ui.shape_table.item(row, 0).text()
-                qty = self.ui.shape_table.cellWidget(row, 1).value()
-                
-                rot_widget = self.ui.shape_table.cellWidget(row, 2)
-                rot_val = rot_widget.findChild(QtGui.QSpinBox).value()
-                override = self.ui.shape_table.cellWidget(row, 3).isChecked()
-                
-                # Get new parameters
-                up_dir_combo = self.ui.shape_table.cellWidget(row, 4)
-                up_direction = up_dir_combo.currentText() if up_dir_combo else "Z+"
-                
-                fill_checkbox = self.ui.shape_table.cellWidget(row, 5)
-                fill_sheet = fill_checkbox.isChecked() if fill_checkbox else False
+                label, qty, rot_val, override, up_direction, fill_sheet = self.ui.get_part_row(row)
                 
                 # Store quantity with effective rotation (based on override) and new params
                 quantities[label] = {
@@ -1032,7 +1105,7 @@ class NestingController:
         # Map objects
         for obj in self.ui.selected_shapes_to_process:
              try:
-                 lbl = obj.Label.replace("master_shape_", "")
+                 lbl = obj.Label.replace(_MASTER_SHAPE_PREFIX, "")
                  if lbl in quantities:
                      master_map[obj.Label] = obj
              except Exception: pass
@@ -9,6 +9,129 @@ from PySide import QtGui, QtCore
 import FreeCAD
 import FreeCADGui
 import os
+from collections import deque
+from contextlib import contextmanager
+from functools import lru_cache
+
+# Columns of the parts table
+COL_LABEL, COL_QUANTITY, COL_ROTATIONS, COL_OVERRIDE, COL_UP_DIR, COL_FILL = range(6)
+UP_DIRECTIONS = ("Z+", "Z-", "Y+", "Y-", "X+", "X-")
+_UP_DIRECTION_INDEX = {direction: i for i, direction in enumerate(UP_DIRECTIONS)}
+
+# Float preferences restored into panel widgets: (parameter name, widget attribute, default)
+_PERSISTED_FLOATS = (
+    ("SheetWidth", "sheet_width_input", 600.0),
+    ("SheetHeight", "sheet_height_input", 600.0),
+    ("PartSpacing", "part_spacing_input", 12.5),
+    ("SheetThickness", "sheet_thickness_input", 3.0),
+    ("LabelSize", "label_size_input", 10.0),
+    ("Simplification", "simplification_input", 1.0),
+)
+
+# Sheet dimension spinboxes built by the panel: (widget attribute, minimum, maximum, default)
+_SHEET_SPINBOXES = (
+    ("sheet_width_input", 1, 10000, 600),
+    ("sheet_height_input", 1, 10000, 600),
+    ("sheet_thickness_input", 0.1, 1000, 3.0),
+    ("part_spacing_input", 0, 1000, 12.5),
+)
+
+# Tooltips, defined once for every panel and table row
+_TOOLTIP_DEFLECTION = (
+    "<b>Curve Angle (Tessellation Quality):</b><br>"
+    "Maximum angular deviation when approximating curves.<br><br>"
+    "<b>Smaller (5-10°):</b> Smoother curves, more points, slower.<br>"
+    "<b>Larger (20-45°):</b> Coarser curves, fewer points, faster.<br><br>"
+    "<i>Tip: 10° is good for most parts. Use 5° for precision, 30°+ for speed.</i>"
+)
+_TOOLTIP_SIMPLIFICATION = (
+    "<b>Simplification (Point Reduction):</b><br>"
+    "Tolerance (mm) for removing redundant boundary points.<br><br>"
+    "<b>Smaller (0.1-0.5):</b> More detailed boundaries, slower nesting.<br>"
+    "<b>Larger (1.0-5.0):</b> Simpler boundaries, faster nesting.<br><br>"
+    "<i>Tip: Set this to your machine's precision tolerance (e.g., 1mm for routers).</i>"
+)
+_TOOLTIP_ROTATION_OVERRIDE = "Override global rotation steps for this part. 0 or 1 means no rotation."
+_TOOLTIP_UP_DIRECTION = "Define which direction is 'up' for this part when projecting to 2D."
+_TOOLTIP_FILL_SHEET = "If checked, this part will be used to fill remaining space after all other parts are placed."
+
+# Named packing directions shown under the Minkowski direction dial
+_DIRECTION_MAP = {0: "Down", 90: "Left", 180: "Up", 270: "Right"}
+# Label text for every dial position (0-359), built once
+_DIAL_LABELS = tuple(_DIRECTION_MAP.get(i) or f"{i}°" for i in range(360))
+
+def _make_spinbox(cls, minimum, maximum, value, decimals=None, step=None, suffix=None, tip=None):
+    """Creates a QSpinBox/QDoubleSpinBox with its range, value and optional display settings."""
+    spinbox = cls()
+    # Values first with signals off, then cosmetics; callers connect signals afterwards
+    spinbox.blockSignals(True)
+    if decimals is not None:
+        spinbox.setDecimals(decimals)
+    spinbox.setRange(minimum, maximum)
+    spinbox.setValue(value)
+    spinbox.blockSignals(False)
+    if step is not None:
+        spinbox.setSingleStep(step)
+    if suffix:
+        spinbox.setSuffix(suffix)
+    if tip:
+        spinbox.setToolTip(tip)
+    return spinbox
+
+# We need to go up three levels from .../Tools/Nesting/ to get to the workbench root.
+_WORKBENCH_ROOT = os.path.abspath(os.path.join(os.path.dirname(os.path.abspath(__file__)), '..', '..', '..'))
+_FONTS_DIR = os.path.join(_WORKBENCH_ROOT, "fonts")
+_DEFAULT_FONT_FILE = "PoiretOne-Regular.ttf"
+_DEFAULT_FONT_PATH = os.path.join(_FONTS_DIR, _DEFAULT_FONT_FILE)
+
+@lru_cache(maxsize=1)
+def _bundled_font_names():
+    """File names of the fonts in the workbench's 'fonts' folder, listed with a single scandir."""
+    try:
+        with os.scandir(_FONTS_DIR) as entries:
+            return frozenset(e.name for e in entries
+                             if e.is_file() and e.name.lower().endswith((".ttf", ".otf")))
+    except OSError:
+        return frozenset()
+
+class PartsTableDelegate(QtGui.QStyledItemDelegate):
+    """
+    Creates the spinbox and combo editors for the parts table on demand, so
+    rows only hold plain item data instead of a set of live widgets each.
+    """
+    def createEditor(self, parent, option, index):
+        column = index.column()
+        if column == COL_QUANTITY:
+            editor = QtGui.QSpinBox(parent)
+            editor.setRange(1, 500)
+            return editor
+        if column == COL_ROTATIONS:
+            editor = QtGui.QSpinBox(parent)
+            editor.setRange(0, 360) # Allow 0 for no rotation
+            return editor
+        if column == COL_UP_DIR:
+            editor = QtGui.QComboBox(parent)
+            editor.addItems(UP_DIRECTIONS)
+            return editor
+        return super(PartsTableDelegate, self).createEditor(parent, option, index)
+
+    def setEditorData(self, editor, index):
+        value = index.data(QtCore.Qt.EditRole)
+        if isinstance(editor, QtGui.QSpinBox):
+            editor.setValue(int(value))
+        elif isinstance(editor, QtGui.QComboBox):
+            editor.setCurrentIndex(_UP_DIRECTION_INDEX.get(value, 0))
+        else:
+            super(PartsTableDelegate, self).setEditorData(editor, index)
+
+    def setModelData(self, editor, model, index):
+        if isinstance(editor, QtGui.QSpinBox):
+            editor.interpretText()
+            model.setData(index, editor.value(), QtCore.Qt.EditRole)
+        elif isinstance(editor, QtGui.QComboBox):
+            model.setData(index, editor.currentText(), QtCore.Qt.EditRole)
+        else:
+            super(PartsTableDelegate, self).setModelData(editor, model, index)
 
 class NestingPanel(QtGui.QWidget):
     """
@@ -20,148 +143,138 @@ class NestingPanel(QtGui.QWidget):
         FreeCAD.Console.PrintMessage("NestingPanel initialized.\n")
         self.setWindowTitle("Nesting Tool")
         self.selected_shapes_to_process = []
-        self.hidden_originals = []
+        self.hidden_originals = [] # ViewObjects of the selected originals, resolved once on load
         self.current_layout = None
         self.selected_font_path = ""
+        self.persisted_settings = {}
+        self._pending_status = deque()
+        self._flush_scheduled = False
+        self._controller = None
+        self.job_running = False
         self.initUI()
-        self.set_default_font()
     
+    def set_job_running(self, running):
+        """Locks the actions that change the parts or the layout while a job runs."""
+        self.job_running = running
+        for widget in (self.nest_button, self.add_parts_button,
+                       self.remove_parts_button, self.shape_table):
+            widget.setEnabled(not running)
+
     def accept(self):
         """Called when the user clicks Standard Button OK / Apply."""
-        if hasattr(self, 'controller'):
-            self.controller.finalize_job()
+        # The running job still draws into the layout, so keep the panel open
+        if self.job_running:
+            return False
+        if self._controller is not None:
+            self._controller.finalize_job()
         return True
 
     def reject(self):
         """Called when the user clicks Standard Button Cancel / Close."""
-        if hasattr(self, 'controller'):
-            self.controller.cancel_job()
+        if self.job_running:
+            return False
+        if self._controller is not None:
+            self._controller.cancel_job()
             
+        # Nothing was hidden when a saved layout was loaded
+        if not self.hidden_originals:
+            return True
+
         # Also ensure visibility is restored if controller didn't fully run
-        for obj in self.hidden_originals:
-             if hasattr(obj, "ViewObject"):
-                 obj.ViewObject.Visibility = True
+        for view_obj in self.hidden_originals:
+             if not view_obj.Visibility:
+                 view_obj.Visibility = True
                  
         return True
 
+    @property
+    def controller(self):
+        """The NestingController, imported and created on first use."""
+        if self._controller is None:
+            from .nesting_controller import NestingController
+            self._controller = NestingController(self)
+        return self._controller
+
     def initUI(self):
+        """Builds the widgets needed to display the panel; the rest waits for showEvent."""
+        self._advanced_built = False
+        self.setUpdatesEnabled(False)
+        try:
+            self._build_core_ui()
+            self.layout().activate()
+        finally:
+            self.setUpdatesEnabled(True)
+
+    def showEvent(self, event):
+        """Finishes building the panel the first time it becomes visible."""
+        if not self._advanced_built:
+            self._advanced_built = True
+            self.setUpdatesEnabled(False)
+            try:
+                self._build_advanced_ui()
+                self.set_default_font()
+                self.layout().activate()
+            finally:
+                self.setUpdatesEnabled(True)
+        super(NestingPanel, self).showEvent(event)
+
+    def _build_core_ui(self):
         main_layout = QtGui.QVBoxLayout()
         form_layout = QtGui.QFormLayout()
-        font_layout = QtGui.QHBoxLayout()
         table_button_layout = QtGui.QHBoxLayout()
         action_button_layout = QtGui.QHBoxLayout()
 
-        self.sheet_width_input = QtGui.QDoubleSpinBox(); self.sheet_width_input.setRange(1, 10000); self.sheet_width_input.setValue(600)
-        self.sheet_height_input = QtGui.QDoubleSpinBox(); self.sheet_height_input.setRange(1, 10000); self.sheet_height_input.setValue(600)
-        self.sheet_thickness_input = QtGui.QDoubleSpinBox(); self.sheet_thickness_input.setRange(0.1, 1000); self.sheet_thickness_input.setValue(3.0)
-        self.part_spacing_input = QtGui.QDoubleSpinBox(); self.part_spacing_input.setRange(0, 1000); self.part_spacing_input.setValue(12.5)
+        for widget_name, minimum, maximum, value in _SHEET_SPINBOXES:
+            setattr(self, widget_name, _make_spinbox(QtGui.QDoubleSpinBox, minimum, maximum, value))
         
         # --- Advanced Boundary Settings ---
         # Deflection is now specified as an angle (degrees) for more intuitive control
         # Internally converted to linear deflection: deflection_mm = angle / 200.0
-        self.deflection_input = QtGui.QDoubleSpinBox()
-        self.deflection_input.setRange(1, 90)
-        self.deflection_input.setValue(30)  # 30° default for faster processing
-        self.deflection_input.setSingleStep(1)
-        self.deflection_input.setDecimals(0)
-        self.deflection_input.setSuffix("°")
-        self.deflection_input.setToolTip(
-            "<b>Curve Angle (Tessellation Quality):</b><br>"
-            "Maximum angular deviation when approximating curves.<br><br>"
-            "<b>Smaller (5-10°):</b> Smoother curves, more points, slower.<br>"
-            "<b>Larger (20-45°):</b> Coarser curves, fewer points, faster.<br><br>"
-            "<i>Tip: 10° is good for most parts. Use 5° for precision, 30°+ for speed.</i>"
+        self.deflection_input = _make_spinbox(
+            QtGui.QDoubleSpinBox, 1, 90, 30,  # 30° default for faster processing
+            decimals=0, step=1, suffix="°",
+            tip=_TOOLTIP_DEFLECTION
         )
         
-        self.simplification_input = QtGui.QDoubleSpinBox(); self.simplification_input.setRange(0.001, 10.0); self.simplification_input.setValue(1.0); self.simplification_input.setSingleStep(0.1); self.simplification_input.setDecimals(3)
-        self.simplification_input.setToolTip(
-            "<b>Simplification (Point Reduction):</b><br>"
-            "Tolerance (mm) for removing redundant boundary points.<br><br>"
-            "<b>Smaller (0.1-0.5):</b> More detailed boundaries, slower nesting.<br>"
-            "<b>Larger (1.0-5.0):</b> Simpler boundaries, faster nesting.<br><br>"
-            "<i>Tip: Set this to your machine's precision tolerance (e.g., 1mm for routers).</i>"
+        self.simplification_input = _make_spinbox(
+            QtGui.QDoubleSpinBox, 0.001, 10.0, 1.0, decimals=3, step=0.1,
+            tip=_TOOLTIP_SIMPLIFICATION
         )
 
 
+        # Per-part values live in the table items; editors are only created while a cell is edited
         self.shape_table = QtGui.QTableWidget()
         self.shape_table.setColumnCount(6)
         self.shape_table.setHorizontalHeaderLabels(["Shape", "Quantity", "Rotations", "Override", "Up Dir", "Fill"])
-
-        # --- Global Rotation Slider ---
-        self.rotation_steps_slider = QtGui.QSlider(QtCore.Qt.Horizontal)
-        self.rotation_steps_slider.setRange(1, 360) # Minimum 1 rotation step
-        self.rotation_steps_slider.setValue(1)     # Default to 1 rotation step
-        self.rotation_steps_spinbox = QtGui.QSpinBox()
-        self.rotation_steps_spinbox.setRange(1, 360) # Minimum 1 rotation step
-        self.rotation_steps_spinbox.setValue(1)     # Default to 1 rotation step
-        self.rotation_steps_spinbox.valueChanged.connect(self.rotation_steps_slider.setValue)
-        self.rotation_steps_slider.valueChanged.connect(self.rotation_steps_spinbox.setValue)
-
-
-        # --- Minkowski Packer Settings ---
-        self.minkowski_settings_group = QtGui.QGroupBox("Minkowski Nester Settings")
-        minkowski_form_layout = QtGui.QFormLayout()
-
-        # Direction Dial for Minkowski
-        self.minkowski_direction_dial = QtGui.QDial()
-        self.minkowski_direction_dial.setRange(0, 359)
-        self.minkowski_direction_dial.setValue(0) # Default to Down
-        self.minkowski_direction_dial.setWrapping(True)
-        self.minkowski_direction_dial.setNotchesVisible(True)
-        self.minkowski_direction_label = QtGui.QLabel("Down")
-        self.minkowski_direction_label.setAlignment(QtCore.Qt.AlignCenter)
-        
-        def update_minkowski_dial_label(value):
-            direction_map = {0: "Down", 90: "Left", 180: "Up", 270: "Right"}
-            direction_text = direction_map.get(value, "")
-            self.minkowski_direction_label.setText(direction_text if direction_text else f"{value}°")
-        self.minkowski_direction_dial.valueChanged.connect(update_minkowski_dial_label)
-
-        minkowski_dial_layout = QtGui.QVBoxLayout()
-        minkowski_dial_layout.addWidget(self.minkowski_direction_dial)
-        minkowski_dial_layout.addWidget(self.minkowski_direction_label)
-
-        # Random Direction Checkbox for Minkowski
-        self.minkowski_random_checkbox = QtGui.QCheckBox("Use Random Strategy")
-        self.minkowski_random_checkbox.setToolTip("If checked, each part will use a randomized placement weighting.")
-        self.minkowski_random_checkbox.stateChanged.connect(lambda state: self.minkowski_direction_dial.setDisabled(state))
-
-        minkowski_form_layout.addRow("Packing Direction:", minkowski_dial_layout)
-        minkowski_form_layout.addRow(self.minkowski_random_checkbox)
-        
-        self.clear_cache_checkbox = QtGui.QCheckBox("Clear NFP Cache")
-        self.clear_cache_checkbox.setChecked(False)
-        self.clear_cache_checkbox.setToolTip("Forces recalculation of No-Fit Polygons. Slower, but resolves potential caching issues.")
-        minkowski_form_layout.addRow(self.clear_cache_checkbox)
-        
-        # Genetic options for Minkowski
-        self.minkowski_population_size_input = QtGui.QSpinBox()
-        self.minkowski_population_size_input.setRange(1, 500)
-        self.minkowski_population_size_input.setValue(1)
-        self.minkowski_population_size_input.setToolTip("Set to 1 for a single pass. Increase with generations for Genetic Algorithm.")
-        
-        self.minkowski_generations_input = QtGui.QSpinBox()
-        self.minkowski_generations_input.setRange(1, 1000)
-        self.minkowski_generations_input.setValue(1) # Default to 1 (No Genetic Loop)
-        self.minkowski_generations_input.setToolTip("Set to 1 for a single pass. Increase to optimize using Genetic Algorithm.")
-
-        minkowski_form_layout.addRow(QtGui.QLabel("")) # Spacer
-        minkowski_form_layout.addRow(QtGui.QLabel("--- Optimization ---"))
-        minkowski_form_layout.addRow("Generations:", self.minkowski_generations_input)
-        minkowski_form_layout.addRow("Population Size:", self.minkowski_population_size_input)
-        
-        self.minkowski_settings_group.setLayout(minkowski_form_layout)
-
-
-
-
+        self.shape_table.setItemDelegate(PartsTableDelegate(self.shape_table))
+        self.shape_table.setEditTriggers(QtGui.QAbstractItemView.AllEditTriggers)
+        # Cells hold single-line values; skip the word-wrap text layout when painting
+        self.shape_table.setWordWrap(False)
+        self.shape_table.itemChanged.connect(self._on_shape_item_changed)
+
+        # The value columns hold short numbers, directions and check boxes, so their
+        # header-based widths are set once here; only the label column is re-measured
+        self.shape_table.resizeColumnsToContents()
+
+        # Bulk edits ask for a column resize; coalesce bursts into a single measuring pass
+        self._resize_timer = QtCore.QTimer(self)
+        self._resize_timer.setSingleShot(True)
+        self._resize_timer.setInterval(50)
+        self._resize_timer.timeout.connect(self._resize_label_column)
+
+        # Row items are cloned from these so their flags are only computed once
+        self._readonly_item_proto = QtGui.QTableWidgetItem()
+        self._readonly_item_proto.setFlags(self._readonly_item_proto.flags() & ~QtCore.Qt.ItemIsEditable)
+        self._checkable_item_proto = QtGui.QTableWidgetItem()
+        self._checkable_item_proto.setFlags(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsSelectable | QtCore.Qt.ItemIsUserCheckable)
+        self._rotation_item_proto = QtGui.QTableWidgetItem()
+        self._rotation_item_proto.setToolTip(_TOOLTIP_ROTATION_OVERRIDE)
+        self._up_dir_item_proto = QtGui.QTableWidgetItem()
+        self._up_dir_item_proto.setToolTip(_TOOLTIP_UP_DIRECTION)
+        self._fill_item_proto = self._checkable_item_proto.clone()
+        self._fill_item_proto.setToolTip(_TOOLTIP_FILL_SHEET)
 
         self.show_bounds_checkbox = QtGui.QCheckBox("Show Bounds"); self.show_bounds_checkbox.setChecked(True)
-        self.add_labels_checkbox = QtGui.QCheckBox("Add Identifier Labels"); self.add_labels_checkbox.setChecked(True)
-        self.label_height_input = QtGui.QDoubleSpinBox(); self.label_height_input.setRange(0, 1000); self.label_height_input.setValue(25.0)
-        self.label_height_input.setToolTip("The height (Z-offset) for the identifier labels.")
-        self.label_size_input = QtGui.QDoubleSpinBox(); self.label_size_input.setRange(1, 100); self.label_size_input.setValue(10.0)
-        self.label_size_input.setToolTip("The text size for identifier labels in mm.")
         self.simulate_nesting_checkbox = QtGui.QCheckBox("Simulate Nesting (slower)"); self.simulate_nesting_checkbox.setChecked(True)
         self.sound_checkbox = QtGui.QCheckBox("Play sound on completion"); self.sound_checkbox.setChecked(True)
         
@@ -171,26 +284,10 @@ class NestingPanel(QtGui.QWidget):
         self.add_parts_button = QtGui.QPushButton("Add Selected")
         self.remove_parts_button = QtGui.QPushButton("Remove Selected")
         
-        # --- Font Selection UI Elements ---
-        self.font_select_button = QtGui.QPushButton("Select Font")
-        self.font_label = QtGui.QLabel("No Font Selected")
-        self.font_label.setWordWrap(True)
-        font_layout.addWidget(self.font_select_button)
-        font_layout.addWidget(self.font_label)
-        
         self.status_label = QtGui.QLabel("Select master shapes to nest.")
         self.status_label.setWordWrap(True)
 
         # --- Layout Assembly ---
-        label_options_layout = QtGui.QHBoxLayout()
-        label_options_layout.addWidget(self.add_labels_checkbox)
-        label_options_layout.addWidget(QtGui.QLabel("Size:"))
-        label_options_layout.addWidget(self.label_size_input)
-        label_options_layout.addWidget(QtGui.QLabel("Height (Z):"))
-        label_options_layout.addWidget(self.label_height_input)
-        label_options_layout.addStretch()
-
-
         form_layout.addRow("Sheet Width:", self.sheet_width_input)
         form_layout.addRow("Sheet Height:", self.sheet_height_input)
         form_layout.addRow("Sheet Thickness:", self.sheet_thickness_input)
@@ -205,16 +302,8 @@ class NestingPanel(QtGui.QWidget):
         
         form_layout.addRow("Bounds Resolution:", curve_settings_layout)
 
-
-        form_layout.addRow(self.minkowski_settings_group)
-
-        form_layout.addRow("Identifier Font:", font_layout)
-        form_layout.addRow(label_options_layout)
-        
-        rotation_layout = QtGui.QHBoxLayout()
-        rotation_layout.addWidget(self.rotation_steps_slider)
-        rotation_layout.addWidget(self.rotation_steps_spinbox)
-        form_layout.addRow("Global Rotation Steps:", rotation_layout)
+        # The advanced rows are inserted here by _build_advanced_ui
+        self._advanced_row_index = form_layout.rowCount()
 
         form_layout.addRow(self.simulate_nesting_checkbox)
         form_layout.addRow(self.show_bounds_checkbox) # Keep this on its own line
@@ -241,102 +330,277 @@ class NestingPanel(QtGui.QWidget):
         main_layout.addWidget(self.status_label)
         main_layout.addStretch()
         
+        self.form_layout = form_layout
         self.setLayout(main_layout)
 
-        # Connect signals
+    def _build_advanced_ui(self):
+        """Builds the Minkowski, font, label and rotation settings and connects the controller."""
+        form_layout = self.form_layout
+        font_layout = QtGui.QHBoxLayout()
 
+        # --- Global Rotation Slider ---
+        self.rotation_steps_slider = QtGui.QSlider(QtCore.Qt.Horizontal)
+        self.rotation_steps_slider.blockSignals(True)
+        self.rotation_steps_slider.setRange(1, 360) # Minimum 1 rotation step
+        self.rotation_steps_slider.setValue(1)     # Default to 1 rotation step
+        self.rotation_steps_slider.blockSignals(False)
+        self.rotation_steps_spinbox = _make_spinbox(QtGui.QSpinBox, 1, 360, 1) # Minimum and default of 1 rotation step
+        # C++ slot to C++ slot, no Python in between; setValue with an unchanged value
+        # doesn't emit, so the pair settles after one round trip.
+        self.rotation_steps_spinbox.valueChanged.connect(self.rotation_steps_slider.setValue)
+        self.rotation_steps_slider.valueChanged.connect(self.rotation_steps_spinbox.setValue)
 
-        # Link label inputs to the add labels checkbox
-        def toggle_label_inputs(state):
-            enabled = state == QtCore.Qt.Checked
-            self.label_size_input.setEnabled(enabled)
-            self.label_height_input.setEnabled(enabled)
+        # --- Minkowski Packer Settings ---
+        self._build_minkowski_group()
+
+        self.add_labels_checkbox = QtGui.QCheckBox("Add Identifier Labels"); self.add_labels_checkbox.setChecked(True)
+        self.label_height_input = _make_spinbox(QtGui.QDoubleSpinBox, 0, 1000, 25.0, tip="The height (Z-offset) for the identifier labels.")
+        self.label_size_input = _make_spinbox(QtGui.QDoubleSpinBox, 1, 100, 10.0, tip="The text size for identifier labels in mm.")
         
-        self.add_labels_checkbox.stateChanged.connect(toggle_label_inputs)
-        toggle_label_inputs(QtCore.Qt.Checked if self.add_labels_checkbox.isChecked() else QtCore.Qt.Unchecked)
+        # --- Font Selection UI Elements ---
+        self.font_select_button = QtGui.QPushButton("Select Font")
+        self.font_label = QtGui.QLabel("No Font Selected")
+        self.font_label.setWordWrap(True)
+        font_layout.addWidget(self.font_select_button)
+        font_layout.addWidget(self.font_label)
+
+        # --- Layout Assembly ---
+        label_options_layout = QtGui.QHBoxLayout()
+        label_options_layout.addWidget(self.add_labels_checkbox)
+        label_options_layout.addWidget(QtGui.QLabel("Size:"))
+        label_options_layout.addWidget(self.label_size_input)
+        label_options_layout.addWidget(QtGui.QLabel("Height (Z):"))
+        label_options_layout.addWidget(self.label_height_input)
+        label_options_layout.addStretch()
+
+        rotation_layout = QtGui.QHBoxLayout()
+        rotation_layout.addWidget(self.rotation_steps_slider)
+        rotation_layout.addWidget(self.rotation_steps_spinbox)
 
-        # Connect the nesting controller
-        from .nesting_controller import NestingController
-        self.controller = NestingController(self)
-        self.nest_button.clicked.connect(self.controller.execute_nesting)
+        row = self._advanced_row_index
+        form_layout.insertRow(row, self.minkowski_settings_group)
+        form_layout.insertRow(row + 1, "Identifier Font:", font_layout)
+        form_layout.insertRow(row + 2, label_options_layout)
+        form_layout.insertRow(row + 3, "Global Rotation Steps:", rotation_layout)
+
+        # Connect signals
+
+
+        # Link label inputs to the add labels checkbox
+        self.add_labels_checkbox.toggled.connect(self.label_size_input.setEnabled)
+        self.add_labels_checkbox.toggled.connect(self.label_height_input.setEnabled)
+        self.label_size_input.setEnabled(self.add_labels_checkbox.isChecked())
+        self.label_height_input.setEnabled(self.add_labels_checkbox.isChecked())
+
+        # Connect the nesting controller. Slots go through self.controller so the
+        # controller module is only imported once something actually needs it.
+        # Geometry work is deferred to the next event loop tick so the button/checkbox
+        # can repaint its new state before the controller blocks the GUI thread.
+        self.nest_button.clicked.connect(self._on_nest_clicked)
         self.font_select_button.clicked.connect(self.select_font_file)
-        self.show_bounds_checkbox.stateChanged.connect(self.controller.toggle_bounds_visibility)
-        self.add_parts_button.clicked.connect(self.controller.add_selected_shapes)
-        self.remove_parts_button.clicked.connect(self.controller.remove_selected_shapes)
+        self.show_bounds_checkbox.toggled.connect(self._on_show_bounds_toggled, QtCore.Qt.QueuedConnection)
+        self.add_parts_button.clicked.connect(self._on_add_parts_clicked)
+        self.remove_parts_button.clicked.connect(self._on_remove_parts_clicked)
         
         # Load persisted settings after all widgets are created
         self.load_persisted_settings()
         
-        # Load initial selection
+        # Load initial selection once the panel is on screen
+        QtCore.QTimer.singleShot(0, self._load_initial_selection)
+
+    @QtCore.Slot()
+    def _load_initial_selection(self):
         self.controller.load_selection()
 
-    def add_part_row(self, row_index, label, quantity=1, rotation_steps=4, override_rotation=False, 
-                       up_direction="Z+", fill_sheet=False):
-        """Helper function to create and populate a single row in the parts table."""
-        label_item = QtGui.QTableWidgetItem(label)
-        label_item.setFlags(label_item.flags() & ~QtCore.Qt.ItemIsEditable)
+    @QtCore.Slot(bool)
+    def _on_show_bounds_toggled(self, checked):
+        self.controller.toggle_bounds_visibility()
+
+    @QtCore.Slot()
+    def _on_add_parts_clicked(self):
+        self.controller.add_selected_shapes()
+
+    @QtCore.Slot()
+    def _on_remove_parts_clicked(self):
+        self.controller.remove_selected_shapes()
+
+    def _build_minkowski_group(self):
+        """Builds the Minkowski nester settings group and its widgets."""
+        self.minkowski_settings_group = QtGui.QGroupBox("Minkowski Nester Settings")
+        minkowski_form_layout = QtGui.QFormLayout()
+
+        # Direction Dial for Minkowski
+        self.minkowski_direction_dial = QtGui.QDial()
+        self.minkowski_direction_dial.setRange(0, 359)
+        self.minkowski_direction_dial.setValue(0) # Default to Down
+        self.minkowski_direction_dial.setWrapping(True)
+        self.minkowski_direction_dial.setNotchesVisible(True)
+        # Report the value on release only, not on every step of a drag
+        self.minkowski_direction_dial.setTracking(False)
+        self.minkowski_direction_label = QtGui.QLabel(_DIAL_LABELS[self.minkowski_direction_dial.value()])
+        self.minkowski_direction_label.setAlignment(QtCore.Qt.AlignCenter)
+        
+        self.minkowski_direction_dial.valueChanged.connect(self._on_minkowski_dial)
+        # While dragging, refresh the label at most once per frame from the dial position
+        self._dial_label_timer = QtCore.QTimer(self)
+        self._dial_label_timer.setSingleShot(True)
+        self._dial_label_timer.setInterval(16)
+        self._dial_label_timer.timeout.connect(self._refresh_minkowski_dial_label)
+        self.minkowski_direction_dial.sliderMoved.connect(self._on_minkowski_dial_moved)
+
+        minkowski_dial_layout = QtGui.QVBoxLayout()
+        minkowski_dial_layout.addWidget(self.minkowski_direction_dial)
+        minkowski_dial_layout.addWidget(self.minkowski_direction_label)
 
-        quantity_spinbox = QtGui.QSpinBox()
-        quantity_spinbox.setRange(1, 500)
-        quantity_spinbox.setValue(quantity)
+        # Random Direction Checkbox for Minkowski
+        self.minkowski_random_checkbox = QtGui.QCheckBox("Use Random Strategy")
+        self.minkowski_random_checkbox.setToolTip("If checked, each part will use a randomized placement weighting.")
+        self.minkowski_random_checkbox.toggled.connect(self.minkowski_direction_dial.setDisabled)
 
-        # --- Rotation Override Widget ---
-        rotation_widget = QtGui.QWidget()
-        rotation_layout = QtGui.QHBoxLayout(rotation_widget)
-        rotation_layout.setContentsMargins(0, 0, 0, 0)
+        minkowski_form_layout.addRow("Packing Direction:", minkowski_dial_layout)
+        minkowski_form_layout.addRow(self.minkowski_random_checkbox)
         
-        rotation_slider = QtGui.QSlider(QtCore.Qt.Horizontal)
-        rotation_slider.setRange(0, 360) # Allow 0 for no rotation
-        rotation_slider.setValue(rotation_steps)
+        self.clear_cache_checkbox = QtGui.QCheckBox("Clear NFP Cache")
+        self.clear_cache_checkbox.setChecked(False)
+        self.clear_cache_checkbox.setToolTip("Forces recalculation of No-Fit Polygons. Slower, but resolves potential caching issues.")
+        minkowski_form_layout.addRow(self.clear_cache_checkbox)
+        
+        # Genetic options for Minkowski
+        self.minkowski_population_size_input = _make_spinbox(
+            QtGui.QSpinBox, 1, 500, 1,
+            tip="Set to 1 for a single pass. Increase with generations for Genetic Algorithm.")
         
-        rotation_spinbox = QtGui.QSpinBox()
-        rotation_spinbox.setRange(0, 360) # Allow 0 for no rotation
-        rotation_spinbox.setValue(rotation_steps)
-        rotation_spinbox.setToolTip("Override global rotation steps for this part. 0 or 1 means no rotation.")
+        self.minkowski_generations_input = _make_spinbox(
+            QtGui.QSpinBox, 1, 1000, 1, # Default to 1 (No Genetic Loop)
+            tip="Set to 1 for a single pass. Increase to optimize using Genetic Algorithm.")
 
-        rotation_slider.valueChanged.connect(rotation_spinbox.setValue)
-        rotation_spinbox.valueChanged.connect(rotation_slider.setValue)
+        minkowski_form_layout.addRow(QtGui.QLabel("")) # Spacer
+        minkowski_form_layout.addRow(QtGui.QLabel("--- Optimization ---"))
+        minkowski_form_layout.addRow("Generations:", self.minkowski_generations_input)
+        minkowski_form_layout.addRow("Population Size:", self.minkowski_population_size_input)
         
-        rotation_layout.addWidget(rotation_slider)
-        rotation_layout.addWidget(rotation_spinbox)
+        self.minkowski_settings_group.setLayout(minkowski_form_layout)
 
-        override_checkbox = QtGui.QCheckBox()
-        override_checkbox.setChecked(override_rotation)
-        override_checkbox.stateChanged.connect(rotation_widget.setEnabled)
-        rotation_widget.setEnabled(override_rotation) # Disabled by default unless overridden
+    @QtCore.Slot()
+    def _on_nest_clicked(self):
+        # Disabled before the run is queued, so a double-click can't queue it twice
+        self.nest_button.setEnabled(False)
+        QtCore.QTimer.singleShot(0, self._run_nesting)
+
+    @QtCore.Slot()
+    def _run_nesting(self):
+        if self.job_running:
+            return
+        try:
+            self.controller.execute_nesting()
+        finally:
+            self.nest_button.setEnabled(True)
 
-        # --- Up Direction Combo ---
-        up_dir_combo = QtGui.QComboBox()
-        up_dir_combo.addItems(["Z+", "Z-", "Y+", "Y-", "X+", "X-"])
-        up_dir_combo.setCurrentText(up_direction)
-        up_dir_combo.setToolTip("Define which direction is 'up' for this part when projecting to 2D.")
+    @QtCore.Slot(int)
+    def _on_minkowski_dial(self, value):
+        """Shows the named direction for the dial value, or the raw angle."""
+        self.minkowski_direction_label.setText(_DIAL_LABELS[value])
+
+    @QtCore.Slot(int)
+    def _on_minkowski_dial_moved(self, position):
+        if not self._dial_label_timer.isActive():
+            self._dial_label_timer.start()
+
+    @QtCore.Slot()
+    def _refresh_minkowski_dial_label(self):
+        self.minkowski_direction_label.setText(_DIAL_LABELS[self.minkowski_direction_dial.sliderPosition()])
+
+    def add_part_row(self, row_index, label, quantity=1, rotation_steps=4, override_rotation=False, 
+                       up_direction="Z+", fill_sheet=False):
+        """Helper function to create and populate a single row in the parts table."""
+        label_item = self._readonly_item_proto.clone()
+        label_item.setText(label)
+
+        quantity_item = QtGui.QTableWidgetItem()
+        quantity_item.setData(QtCore.Qt.EditRole, int(quantity))
+
+        # --- Rotation Override ---
+        rotation_item = self._rotation_item_proto.clone()
+        rotation_item.setData(QtCore.Qt.EditRole, int(rotation_steps))
+
+        override_item = self._checkable_item_proto.clone()
+        override_item.setCheckState(QtCore.Qt.Checked if override_rotation else QtCore.Qt.Unchecked)
+        self._set_rotation_item_enabled(rotation_item, override_rotation) # Disabled by default unless overridden
+
+        # --- Up Direction ---
+        up_dir_item = self._up_dir_item_proto.clone()
+        # Unknown values fall back to the first choice, as the combo editor would show them
+        up_dir_item.setData(QtCore.Qt.EditRole, up_direction if up_direction in _UP_DIRECTION_INDEX else UP_DIRECTIONS[0])
 
         # --- Fill Sheet Checkbox ---
-        fill_checkbox = QtGui.QCheckBox()
-        fill_checkbox.setChecked(fill_sheet)
-        fill_checkbox.setToolTip("If checked, this part will be used to fill remaining space after all other parts are placed.")
+        fill_item = self._fill_item_proto.clone()
+        fill_item.setCheckState(QtCore.Qt.Checked if fill_sheet else QtCore.Qt.Unchecked)
+
+        self.shape_table.setItem(row_index, COL_LABEL, label_item)
+        self.shape_table.setItem(row_index, COL_QUANTITY, quantity_item)
+        self.shape_table.setItem(row_index, COL_ROTATIONS, rotation_item)
+        self.shape_table.setItem(row_index, COL_OVERRIDE, override_item)
+        self.shape_table.setItem(row_index, COL_UP_DIR, up_dir_item)
+        self.shape_table.setItem(row_index, COL_FILL, fill_item)
+
+    def get_part_row(self, row_index):
+        """Returns (label, quantity, rotation_steps, override, up_direction, fill_sheet) for a table row."""
+        table = self.shape_table
+        up_dir = table.item(row_index, COL_UP_DIR)
+        fill = table.item(row_index, COL_FILL)
+        return (
+            table.item(row_index, COL_LABEL).text(),
+            int(table.item(row_index, COL_QUANTITY).data(QtCore.Qt.EditRole)),
+            int(table.item(row_index, COL_ROTATIONS).data(QtCore.Qt.EditRole)),
+            table.item(row_index, COL_OVERRIDE).checkState() == QtCore.Qt.Checked,
+            up_dir.data(QtCore.Qt.EditRole) if up_dir else "Z+",
+            fill.checkState() == QtCore.Qt.Checked if fill else False,
+        )
 
-        self.shape_table.setItem(row_index, 0, label_item)
-        self.shape_table.setCellWidget(row_index, 1, quantity_spinbox)
-        self.shape_table.setCellWidget(row_index, 2, rotation_widget)
-        self.shape_table.setCellWidget(row_index, 3, override_checkbox)
-        self.shape_table.setCellWidget(row_index, 4, up_dir_combo)
-        self.shape_table.setCellWidget(row_index, 5, fill_checkbox)
+    @staticmethod
+    def _set_rotation_item_enabled(rotation_item, enabled):
+        flags = rotation_item.flags()
+        if enabled:
+            rotation_item.setFlags(flags | QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable)
+        else:
+            rotation_item.setFlags(flags & ~(QtCore.Qt.ItemIsEnabled | QtCore.Qt.ItemIsEditable))
+
+    @QtCore.Slot(QtGui.QTableWidgetItem)
+    def _on_shape_item_changed(self, item):
+        """Enables the per-part rotation cell only while its override box is ticked."""
+        if item.column() != COL_OVERRIDE:
+            return
+        rotation_item = self.shape_table.item(item.row(), COL_ROTATIONS)
+        if rotation_item:
+            self._set_rotation_item_enabled(rotation_item, item.checkState() == QtCore.Qt.Checked)
+
+    @QtCore.Slot()
+    def _resize_label_column(self):
+        self.shape_table.resizeColumnToContents(COL_LABEL)
+
+    def schedule_table_resize(self):
+        """Resizes the table columns to their contents once the current burst of edits settles."""
+        self._resize_timer.start()
+
+    @contextmanager
+    def batch_table_update(self):
+        """Suspends repaints, signals and sorting on the parts table while rows are built."""
+        table = self.shape_table
+        sorting = table.isSortingEnabled()
+        table.setSortingEnabled(False)
+        table.setUpdatesEnabled(False)
+        was_blocked = table.blockSignals(True)
+        try:
+            yield table
+        finally:
+            table.blockSignals(was_blocked)
+            table.setUpdatesEnabled(True)
+            table.setSortingEnabled(sorting)
 
     def select_font_file(self):
         """Opens a file dialog to let the user select a font file."""
-        # Correctly find the workbench's root directory and the 'fonts' subfolder
-        try:
-            # __file__ is the path to this file (ui_nesting.py)
-            # os.path.dirname gives the directory it's in (.../nesting)
-            # We need to go up three levels from .../Tools/Nesting/ to get to the workbench root.
-            current_dir = os.path.dirname(os.path.abspath(__file__))
-            workbench_root = os.path.abspath(os.path.join(current_dir, '..', '..', '..'))
-            default_font_dir = os.path.join(workbench_root, "fonts")
-            if not os.path.isdir(default_font_dir):
-                default_font_dir = "" # Fallback if fonts dir doesn't exist
-        except:
-            default_font_dir = "" # Fallback on any error
+        # Start in the bundled fonts folder when it exists and holds any fonts
+        default_font_dir = _FONTS_DIR if _bundled_font_names() else ""
 
         file_dialog_result = QtGui.QFileDialog.getOpenFileName(
             self, 
@@ -345,6 +609,8 @@ class NestingPanel(QtGui.QWidget):
             "Font Files (*.ttf *.otf)"
         )
         font_path = file_dialog_result[0]
+        # The user may have added fonts while the dialog was open
+        _bundled_font_names.cache_clear()
 
         if font_path:
             self.selected_font_path = font_path
@@ -353,21 +619,52 @@ class NestingPanel(QtGui.QWidget):
 
     def set_default_font(self):
         """Checks for and sets a default font on initialization."""
-        try:
-            workbench_root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
-            fonts_dir = os.path.join(workbench_root, "fonts")
-            default_font_file = "PoiretOne-Regular.ttf"
-            default_font_path = os.path.join(fonts_dir, default_font_file)
-
-            if os.path.exists(default_font_path):
-                self.selected_font_path = default_font_path
-                self.font_label.setText(default_font_file)
-        except Exception:
-            # Silently fail, no default will be set.
-            pass
+        if _DEFAULT_FONT_FILE in _bundled_font_names():
+            self.selected_font_path = _DEFAULT_FONT_PATH
+            self.font_label.setText(_DEFAULT_FONT_FILE)
 
     def log_message(self, message, level="message"):
-        """Displays a message in the status label and logs to the console."""
+        """
+        Queues a message for the status label and console. Bursts of messages are
+        flushed together on the GUI thread's next event loop pass.
+
+        Safe to call from the nesting engine's worker threads: it never pumps the
+        event loop itself, the progress updates of a running job already do that.
+        """
+        self._pending_status.append((message, level))
+        if not self._flush_scheduled:
+            self._flush_scheduled = True
+            try:
+                # Posted to this panel's (GUI) thread whichever thread logged the message
+                QtCore.QMetaObject.invokeMethod(self, "_flush_status", QtCore.Qt.QueuedConnection)
+            except RuntimeError:
+                # The panel's C++ object has been deleted (dialog closed) while a job
+                # still logs; the messages still reach the console.
+                self._flush_scheduled = False
+                while self._pending_status:
+                    message, level = self._pending_status.popleft()
+                    self._print_console(message + "\n", level)
+
+    @QtCore.Slot()
+    def _flush_status(self):
+        """Writes queued messages to the console and shows the latest one in the status label."""
+        self._flush_scheduled = False
+        pending = self._pending_status
+        if not pending:
+            return
+
+        # Consecutive messages of the same level go to the console in one call
+        run_level, run = pending[0][1], []
+        while pending:
+            message, level = pending.popleft()
+            if level != run_level:
+                run.append("")
+                self._print_console("\n".join(run), run_level)
+                run_level, run = level, []
+            run.append(message)
+        run.append("")
+        self._print_console("\n".join(run), run_level)
+
         try:
             self.status_label.setText(message)
         except RuntimeError:
@@ -375,28 +672,26 @@ class NestingPanel(QtGui.QWidget):
             # We can just log to console and ignore the UI update.
             pass
 
+    @staticmethod
+    def _print_console(text, level):
         if level == "warning":
-            FreeCAD.Console.PrintWarning(message + "\n")
+            FreeCAD.Console.PrintWarning(text)
         else:
-            FreeCAD.Console.PrintMessage(message + "\n")
-        
-        # Process UI events to make sure the label updates immediately
-        # We wrap this too, just in case
-        try:
-            QtGui.QApplication.processEvents()
-        except RuntimeError:
-            pass
+            FreeCAD.Console.PrintMessage(text)
 
     def load_persisted_settings(self):
         """Loads settings from FreeCAD preferences."""
         prefs = FreeCAD.ParamGet("User parameter:BaseApp/Preferences/NestingWorkbench")
-        self.sheet_width_input.setValue(prefs.GetFloat("SheetWidth", 600.0))
-        self.sheet_height_input.setValue(prefs.GetFloat("SheetHeight", 600.0))
-        self.part_spacing_input.setValue(prefs.GetFloat("PartSpacing", 12.5))
-        self.sheet_thickness_input.setValue(prefs.GetFloat("SheetThickness", 3.0))
-        self.label_size_input.setValue(prefs.GetFloat("LabelSize", 10.0))
+        saved = {key: prefs.GetFloat(key, default) for key, _, default in _PERSISTED_FLOATS}
+        # Apply in one pass with signals off; nothing needs to react to restored values
+        for key, widget_name, _ in _PERSISTED_FLOATS:
+            widget = getattr(self, widget_name)
+            was_blocked = widget.blockSignals(True)
+            widget.setValue(saved[key])
+            widget.blockSignals(was_blocked)
         # Load deflection angle (new format) or use default of 30°
         deflection_angle = prefs.GetFloat("DeflectionAngle", 0)
+        saved["DeflectionAngle"] = deflection_angle
         if deflection_angle == 0:
             # Backward compatibility: convert old Deflection (mm) to angle, or use 30° default
             old_deflection = prefs.GetFloat("Deflection", 0)
@@ -404,8 +699,11 @@ class NestingPanel(QtGui.QWidget):
                 deflection_angle = old_deflection * 200.0  # Inverse of mm = angle/200
             else:
                 deflection_angle = 30  # Default
+        was_blocked = self.deflection_input.blockSignals(True)
         self.deflection_input.setValue(deflection_angle)
-        self.simplification_input.setValue(prefs.GetFloat("Simplification", 1.0))
+        self.deflection_input.blockSignals(was_blocked)
+        # Remember what is stored so the controller only writes back changed values
+        self.persisted_settings = saved
         
     def update_progress(self, current, total, message=None):
         """Updates the progress bar."""
@@ -10,8 +10,31 @@ Supports two methods:
 
 import FreeCAD
 import Part
+try:
+    # Shapely 2 returns all coordinates of a ring as one array in a single GEOS call
+    from shapely import get_coordinates
+except ImportError:
+    get_coordinates = None
 from ..Nesting.algorithms.shape_processor import get_2d_profile_from_obj
 
+# Types that may carry a Shape but are containers or datums, not parts
+_GROUP_TYPES = frozenset((
+    "App::DocumentObjectGroup",
+    "App::Part",
+    "App::Origin",
+    "App::Line",
+    "App::Plane",
+))
+
+# Relative area difference under which a polygon is treated as its bounding box
+_RECTANGLE_TOLERANCE = 1e-9
+
+# Constant FreeCAD values, built once. Property assignment copies them, so
+# sharing these instances between objects is safe.
+_Z_AXIS = FreeCAD.Vector(0, 0, 1)
+_IDENTITY_PLACEMENT = FreeCAD.Placement()
+_OUTLINE_COLOR = (0.2, 0.6, 1.0)  # Light blue
+
 
 def create_cross_section(obj, cut_height=None):
     """
@@ -34,40 +57,43 @@ def create_cross_section(obj, cut_height=None):
             FreeCAD.Console.PrintWarning(f"[CrossSection] Shape is null for '{obj.Label}'\n")
             return None
         
-        # Get bounding box to determine cut height
-        bbox = shape.BoundBox
-        
         if cut_height is None:
-            # Default to midpoint of the part's height
+            # Default to midpoint of the part's height. The bounding box is
+            # only computed when no explicit height was given.
+            bbox = shape.BoundBox
             cut_height = (bbox.ZMin + bbox.ZMax) / 2.0
         
         # Create a cutting plane and slice
-        cutting_direction = FreeCAD.Vector(0, 0, 1)  # Normal to XY plane
-        wires = shape.slice(cutting_direction, cut_height)
+        wires = shape.slice(_Z_AXIS, cut_height)  # Plane normal to Z
         
         if not wires:
             FreeCAD.Console.PrintWarning(f"[Silhouette] No cross-section at Z={cut_height:.2f} for '{obj.Label}'\n")
             return None
         
-        # Convert wires to faces
-        faces = []
-        for wire in wires:
-            if wire.isClosed():
-                try:
-                    face = Part.Face(wire)
-                    faces.append(face)
-                except Exception as e:
-                    FreeCAD.Console.PrintWarning(f"[CrossSection] Could not make face from wire: {e}\n")
-        
-        if not faces:
+        closed_wires = [wire for wire in wires if wire.isClosed()]
+        if not closed_wires:
             FreeCAD.Console.PrintWarning(f"[CrossSection] No closed wires found for '{obj.Label}'\n")
             return None
         
-        # Combine faces if multiple
-        if len(faces) == 1:
-            result = faces[0]
+        if len(closed_wires) == 1:
+            result = Part.Face(closed_wires[0])
         else:
-            result = Part.Compound(faces)
+            # Let the face maker sort the wires into islands and holes in one
+            # pass; it returns a single face, or a compound only when the
+            # section really has several separate islands
+            try:
+                result = Part.Face(closed_wires, "Part::FaceMakerBullseye")
+            except Exception as e:
+                FreeCAD.Console.PrintWarning(f"[CrossSection] Could not make face from wires: {e}\n")
+                faces = []
+                for wire in closed_wires:
+                    try:
+                        faces.append(Part.Face(wire))
+                    except Exception as e:
+                        FreeCAD.Console.PrintWarning(f"[CrossSection] Could not make face from wire: {e}\n")
+                if not faces:
+                    return None
+                result = faces[0] if len(faces) == 1 else Part.Compound(faces)
         
         # Move the result to Z=0
         result.translate(FreeCAD.Vector(0, 0, -cut_height))
@@ -97,23 +123,19 @@ def is_valid_shape_object(obj):
     if not hasattr(obj, "Shape"):
         return False, f"No Shape attribute (type: {obj.TypeId})"
     
+    # Check for groups/containers that may have a Shape but aren't geometric objects.
+    # TypeId is a plain string, so test it before fetching the shape.
+    if obj.TypeId in _GROUP_TYPES:
+        return False, f"Object is a container/group ({obj.TypeId})"
+    
+    # Each obj.Shape access wraps a fresh copy of the shape, so fetch it once
+    shape = obj.Shape
+    
     # Check if Shape is null/empty
-    if obj.Shape.isNull():
+    if shape.isNull():
         return False, "Shape is null"
     
-    # Check for groups/containers that may have a Shape but aren't geometric objects
-    group_types = [
-        "App::DocumentObjectGroup",
-        "App::Part",
-        "App::Origin",
-        "App::Line",
-        "App::Plane"
-    ]
-    if obj.TypeId in group_types:
-        return False, f"Object is a container/group ({obj.TypeId})"
-    
     # Check if shape has actual geometry (faces, edges, or solids)
-    shape = obj.Shape
     if not (shape.Faces or shape.Edges or shape.Solids):
         return False, "Shape has no geometry (no faces, edges, or solids)"
     
@@ -151,6 +173,14 @@ def create_silhouette(obj, up_direction="Z+"):
         return None
 
 
+def _ring_coords(ring):
+    """Returns the (x, y) coordinates of a Shapely ring as a list."""
+    if get_coordinates is not None:
+        # One GEOS call for the whole ring
+        return get_coordinates(ring).tolist()
+    return list(ring.coords)
+
+
 def shapely_to_fc_face(shapely_polygon):
     """
     Converts a Shapely polygon to a FreeCAD Face.
@@ -168,41 +198,74 @@ def shapely_to_fc_face(shapely_polygon):
     if not isinstance(shapely_polygon, Polygon):
         raise ValueError(f"Expected Polygon, got {type(shapely_polygon)}")
     
-    # Create outer wire from exterior coordinates
-    exterior_coords = list(shapely_polygon.exterior.coords)
-    outer_points = [FreeCAD.Vector(x, y, 0) for x, y in exterior_coords]
+    # Plate-like parts often project to an axis-aligned rectangle carrying
+    # many redundant vertices. A solid polygon that fills its own bounding
+    # box is exactly that rectangle, so build it from the four corners.
+    if not shapely_polygon.interiors:
+        min_x, min_y, max_x, max_y = shapely_polygon.bounds
+        box_area = (max_x - min_x) * (max_y - min_y)
+        if box_area > 0 and shapely_polygon.area >= box_area * (1.0 - _RECTANGLE_TOLERANCE):
+            return coords_to_fc_face([
+                (min_x, min_y), (max_x, min_y), (max_x, max_y), (min_x, max_y), (min_x, min_y)
+            ])
+    
+    return coords_to_fc_face(
+        _ring_coords(shapely_polygon.exterior),
+        [_ring_coords(interior) for interior in shapely_polygon.interiors]
+    )
+
+
+def coords_to_fc_face(exterior, interiors=()):
+    """
+    Builds a FreeCAD Face at Z=0 directly from ring coordinates.
+    
+    Callers that already hold plain coordinates can use this instead of
+    constructing a Shapely polygon just to have it converted again.
+    
+    Args:
+        exterior: Closed sequence of (x, y) pairs for the outer boundary
+        interiors: Iterable of closed (x, y) sequences, one per hole
+        
+    Returns:
+        Part.Face: The FreeCAD face
+    """
+    # Part.makePolygon converts tuples to points in C++, so no FreeCAD.Vector
+    # wrapper has to be created per vertex
+    outer_points = [(x, y, 0.0) for x, y in exterior]
     
     if len(outer_points) < 3:
         raise ValueError("Not enough points to create face")
     
-    # Close the wire if needed
-    if outer_points[0] != outer_points[-1]:
-        outer_points.append(outer_points[0])
+    # Rings are expected closed (first coordinate == last), as Shapely
+    # LinearRings always are, so the points go straight to makePolygon
     
     # Create outer wire
     outer_wire = Part.makePolygon(outer_points)
     
     # Create wires for holes (interior rings)
     hole_wires = []
-    for interior in shapely_polygon.interiors:
-        hole_coords = list(interior.coords)
-        hole_points = [FreeCAD.Vector(x, y, 0) for x, y in hole_coords]
+    for interior in interiors:
+        hole_points = [(x, y, 0.0) for x, y in interior]
         if len(hole_points) >= 3:
-            if hole_points[0] != hole_points[-1]:
-                hole_points.append(hole_points[0])
             hole_wires.append(Part.makePolygon(hole_points))
     
-    # Create face from outer wire
-    face = Part.Face(outer_wire)
+    if not hole_wires:
+        return Part.Face(outer_wire)
     
-    # Cut out holes if any
-    if hole_wires:
-        for hole_wire in hole_wires:
-            try:
-                hole_face = Part.Face(hole_wire)
-                face = face.cut(hole_face)
-            except Exception as e:
-                FreeCAD.Console.PrintWarning(f"Could not cut hole: {e}\n")
+    # Build the face with its holes in one step; the face maker nests the
+    # inner wires topologically instead of running a boolean cut per hole
+    try:
+        return Part.Face([outer_wire] + hole_wires)
+    except Exception as e:
+        FreeCAD.Console.PrintWarning(f"Could not build face with holes, cutting them instead: {e}\n")
+    
+    face = Part.Face(outer_wire)
+    for hole_wire in hole_wires:
+        try:
+            hole_face = Part.Face(hole_wire)
+            face = face.cut(hole_face)
+        except Exception as e:
+            FreeCAD.Console.PrintWarning(f"Could not cut hole: {e}\n")
     
     return face
 
@@ -227,7 +290,7 @@ def create_silhouette_container(doc, source_obj, up_direction="Z+"):
         FreeCAD.Console.PrintWarning(f"[Silhouette] Skipping '{source_obj.Label}': {reason}\n")
         return None, None
     
-    FreeCAD.Console.PrintMessage(f"[Silhouette] Object validated. Creating silhouette...\n")
+    FreeCAD.Console.PrintLog(f"[Silhouette] Object validated. Creating silhouette...\n")
     
     # Create the silhouette face
     silhouette_face = create_silhouette(source_obj, up_direction)
@@ -236,7 +299,7 @@ def create_silhouette_container(doc, source_obj, up_direction="Z+"):
         FreeCAD.Console.PrintError(f"[Silhouette] Failed to create silhouette face for '{source_obj.Label}'\n")
         return None, None
     
-    FreeCAD.Console.PrintMessage(f"[Silhouette] Silhouette face created. Building container...\n")
+    FreeCAD.Console.PrintLog(f"[Silhouette] Silhouette face created. Building container...\n")
     
     # Create container
     container_name = f"Silhouette_{source_obj.Label}"
@@ -244,14 +307,16 @@ def create_silhouette_container(doc, source_obj, up_direction="Z+"):
     
     # Create a link to the source object (or copy if linking not desired)
     # Using a simple Part::Feature copy for now - links can be complex
+    # obj.Shape already hands back a separate TopoShape sharing the OCC
+    # topology, so it can be assigned without a deep copy()
     source_copy = doc.addObject("Part::Feature", f"Source_{source_obj.Label}")
-    source_copy.Shape = source_obj.Shape.copy()
+    source_copy.Shape = source_obj.Shape
     
     # Copy placement if object has one, otherwise use identity
     if hasattr(source_obj, "Placement"):
         source_copy.Placement = source_obj.Placement
     else:
-        source_copy.Placement = FreeCAD.Placement()
+        source_copy.Placement = _IDENTITY_PLACEMENT
     
     container.addObject(source_copy)
     
@@ -261,11 +326,11 @@ def create_silhouette_container(doc, source_obj, up_direction="Z+"):
     
     # Position silhouette at Z=0, centered like the source
     # The projection is already centered at origin from get_2d_profile_from_obj
-    silhouette_obj.Placement = FreeCAD.Placement(FreeCAD.Vector(0, 0, 0), FreeCAD.Rotation())
+    silhouette_obj.Placement = _IDENTITY_PLACEMENT
     
     # Style the silhouette
     if hasattr(silhouette_obj, "ViewObject"):
-        silhouette_obj.ViewObject.ShapeColor = (0.2, 0.6, 1.0)  # Light blue
+        silhouette_obj.ViewObject.ShapeColor = _OUTLINE_COLOR
         silhouette_obj.ViewObject.Transparency = 50
         silhouette_obj.ViewObject.LineWidth = 2.0
     
@@ -290,6 +355,32 @@ def is_layout_group(obj):
             obj.Label.startswith("Layout_"))
 
 
+def _iter_layout_sheets(layout_group):
+    """
+    Walks a Layout group once and yields its sheets with their shapes groups.
+    
+    Args:
+        layout_group: A FreeCAD DocumentObjectGroup that is a Layout
+        
+    Yields:
+        tuple: (sheet_group, [shapes_group, ...]) for every Sheet_X group
+    """
+    for sheet_group in layout_group.Group:
+        # Sheet groups are named Sheet_0, Sheet_1, etc.
+        if not sheet_group.isDerivedFrom("App::DocumentObjectGroup"):
+            continue
+        if not sheet_group.Label.startswith("Sheet_"):
+            continue
+        
+        # Shapes_X groups contain the placed parts
+        shapes_groups = [
+            sub_group for sub_group in sheet_group.Group
+            if sub_group.isDerivedFrom("App::DocumentObjectGroup")
+            and sub_group.Label.startswith("Shapes_")
+        ]
+        yield sheet_group, shapes_groups
+
+
 def get_parts_from_layout_by_sheet(layout_group):
     """
     Extracts all placed part objects from a Layout group, organized by sheet.
@@ -305,60 +396,53 @@ def get_parts_from_layout_by_sheet(layout_group):
     """
     sheets_data = {}
     
+    # Per-object trace lines go to PrintLog, which FreeCAD only shows when log
+    # messages are enabled in the report view; the summaries stay as messages
     FreeCAD.Console.PrintMessage(f"[Silhouette] Scanning Layout '{layout_group.Label}'...\n")
     
-    for sheet_group in layout_group.Group:
-        # Sheet groups are named Sheet_0, Sheet_1, etc.
-        if not sheet_group.isDerivedFrom("App::DocumentObjectGroup"):
-            continue
-            
-        if not sheet_group.Label.startswith("Sheet_"):
-            continue
-            
-        FreeCAD.Console.PrintMessage(f"[Silhouette]   Found sheet: {sheet_group.Label}\n")
+    for sheet_group, shapes_groups in _iter_layout_sheets(layout_group):
+        FreeCAD.Console.PrintLog(f"[Silhouette]   Found sheet: {sheet_group.Label}\n")
         
         sheet_parts = []
         
-        for sub_group in sheet_group.Group:
-            # Look for Shapes_X groups containing the placed parts
-            if not sub_group.isDerivedFrom("App::DocumentObjectGroup"):
-                continue
-                
-            if sub_group.Label.startswith("Shapes_"):
-                FreeCAD.Console.PrintMessage(f"[Silhouette]     Found shapes group: {sub_group.Label}\n")
-                
-                for container in sub_group.Group:
-                    # Parts are inside App::Part containers (like nested_Side_1)
-                    if container.TypeId == "App::Part":
-                        FreeCAD.Console.PrintMessage(f"[Silhouette]       Found container: {container.Label}\n")
-                        
-                        # Get the container's placement - this is where the part is positioned
+        for sub_group in shapes_groups:
+            FreeCAD.Console.PrintLog(f"[Silhouette]     Found shapes group: {sub_group.Label}\n")
+            
+            for container in sub_group.Group:
+                # Parts are inside App::Part containers (like nested_Side_1)
+                # Label is a property read through FreeCAD, so fetch it once per object
+                container_label = container.Label
+                if container.TypeId == "App::Part":
+                    FreeCAD.Console.PrintLog(f"[Silhouette]       Found container: {container_label}\n")
+                    
+                    # Get the container's placement - this is where the part is positioned
+                    container_placement = container.Placement if hasattr(container, "Placement") else FreeCAD.Placement()
+                    
+                    # Look inside the container for the actual part object
+                    # We only want "part_*" objects, not boundary or label objects
+                    if hasattr(container, "Group"):
+                        for child in container.Group:
+                            # Only process objects that start with "part_"
+                            child_label = child.Label
+                            if child_label.startswith("part_"):
+                                is_valid, reason = is_valid_shape_object(child)
+                                if is_valid:
+                                    # Store both the part and its container's placement
+                                    sheet_parts.append((child, container_placement, container_label))
+                                    FreeCAD.Console.PrintLog(f"[Silhouette]         Found part: {child_label}\n")
+                else:
+                    # Try as direct Part::Feature (fallback)
+                    is_valid, reason = is_valid_shape_object(container)
+                    if is_valid:
                         container_placement = container.Placement if hasattr(container, "Placement") else FreeCAD.Placement()
-                        
-                        # Look inside the container for the actual part object
-                        # We only want "part_*" objects, not boundary or label objects
-                        if hasattr(container, "Group"):
-                            for child in container.Group:
-                                # Only process objects that start with "part_"
-                                if child.Label.startswith("part_"):
-                                    is_valid, reason = is_valid_shape_object(child)
-                                    if is_valid:
-                                        # Store both the part and its container's placement
-                                        sheet_parts.append((child, container_placement, container.Label))
-                                        FreeCAD.Console.PrintMessage(f"[Silhouette]         Found part: {child.Label}\n")
+                        sheet_parts.append((container, container_placement, container_label))
+                        FreeCAD.Console.PrintLog(f"[Silhouette]       Found part: {container_label}\n")
                     else:
-                        # Try as direct Part::Feature (fallback)
-                        is_valid, reason = is_valid_shape_object(container)
-                        if is_valid:
-                            container_placement = container.Placement if hasattr(container, "Placement") else FreeCAD.Placement()
-                            sheet_parts.append((container, container_placement, container.Label))
-                            FreeCAD.Console.PrintMessage(f"[Silhouette]       Found part: {container.Label}\n")
-                        else:
-                            FreeCAD.Console.PrintMessage(f"[Silhouette]       Skipping: {container.Label} ({reason})\n")
+                        FreeCAD.Console.PrintLog(f"[Silhouette]       Skipping: {container_label} ({reason})\n")
         
         if sheet_parts:
             sheets_data[sheet_group] = sheet_parts
-            FreeCAD.Console.PrintMessage(f"[Silhouette]   Sheet '{sheet_group.Label}': {len(sheet_parts)} parts\n")
+            FreeCAD.Console.PrintLog(f"[Silhouette]   Sheet '{sheet_group.Label}': {len(sheet_parts)} parts\n")
     
     total_parts = sum(len(parts) for parts in sheets_data.values())
     FreeCAD.Console.PrintMessage(f"[Silhouette] Found {total_parts} parts across {len(sheets_data)} sheets\n")
@@ -383,24 +467,16 @@ def create_silhouettes_for_layout(doc, layout_group, cut_height=None, method="cr
     """
     all_silhouettes = []
     sheets_processed = set()
+    targets = []
+    stale_outlines = []
     
     FreeCAD.Console.PrintMessage(f"[Silhouette] Processing Layout '{layout_group.Label}'...\n")
     
     # Traverse layout → sheets → shapes groups → containers
-    for sheet_group in layout_group.Group:
-        if not sheet_group.isDerivedFrom("App::DocumentObjectGroup"):
-            continue
-        if not sheet_group.Label.startswith("Sheet_"):
-            continue
-        
+    for sheet_group, shapes_groups in _iter_layout_sheets(layout_group):
         sheets_processed.add(sheet_group.Label)
         
-        for sub_group in sheet_group.Group:
-            if not sub_group.isDerivedFrom("App::DocumentObjectGroup"):
-                continue
-            if not sub_group.Label.startswith("Shapes_"):
-                continue
-            
+        for sub_group in shapes_groups:
             for container in sub_group.Group:
                 # Only process App::Part containers (like nested_Side_1)
                 if container.TypeId != "App::Part":
@@ -409,59 +485,62 @@ def create_silhouettes_for_layout(doc, layout_group, cut_height=None, method="cr
                     continue
                 
                 # Find the part_* object inside the container
-                # Also check for existing outline_* objects to remove them
+                # Also collect existing outline_* objects to remove them
                 part_obj = None
-                existing_outlines = []
                 if hasattr(container, "Group"):
                     for child in container.Group:
-                        if child.Label.startswith("part_"):
+                        # Label is a property read through FreeCAD, so fetch it once per child
+                        child_label = child.Label
+                        if child_label.startswith("part_"):
                             is_valid, reason = is_valid_shape_object(child)
                             if is_valid:
                                 part_obj = child
-                        elif child.Label.startswith("outline_"):
-                            existing_outlines.append(child)
-                
-                # Remove existing silhouettes before creating new ones
-                for old_outline in existing_outlines:
-                    try:
-                        doc.removeObject(old_outline.Name)
-                    except Exception as e:
-                        FreeCAD.Console.PrintWarning(f"[Silhouette] Could not remove old outline '{old_outline.Label}': {e}\\n")
-                
-                if part_obj is None:
-                    continue
+                        elif child_label.startswith("outline_"):
+                            stale_outlines.append(child)
                 
-                try:
-                    # Create silhouette
-                    if method == "cross_section":
-                        silhouette_face = create_cross_section(part_obj, cut_height)
-                    else:
-                        silhouette_face = create_silhouette(part_obj)
-                    
-                    if silhouette_face is None:
-                        FreeCAD.Console.PrintWarning(f"[Silhouette] Could not create silhouette for '{container.Label}'\n")
-                        continue
-                    
-                    # Create silhouette object INSIDE the container
-                    silhouette_obj = doc.addObject("Part::Feature", f"outline_{container.Label}")
-                    silhouette_obj.Shape = silhouette_face
-                    
-                    # Position at Z=0 with no offset (cross-section already translated)
-                    silhouette_obj.Placement = FreeCAD.Placement()
-                    
-                    # Style the silhouette
-                    if hasattr(silhouette_obj, "ViewObject"):
-                        silhouette_obj.ViewObject.ShapeColor = (0.2, 0.6, 1.0)  # Light blue
-                        silhouette_obj.ViewObject.Transparency = 50
-                        silhouette_obj.ViewObject.LineWidth = 2.0
-                    
-                    # Add to the container (alongside the part)
-                    container.addObject(silhouette_obj)
-                    all_silhouettes.append(silhouette_obj)
-                    
-                except Exception as e:
-                    FreeCAD.Console.PrintError(f"[Silhouette] Error for '{container.Label}': {e}\n")
-                    continue
+                if part_obj is not None:
+                    targets.append((container, part_obj))
+    
+    # Remove existing silhouettes in one sweep once the walk is done, so the
+    # groups being iterated are not modified underneath it
+    for old_outline in stale_outlines:
+        try:
+            doc.removeObject(old_outline.Name)
+        except Exception as e:
+            FreeCAD.Console.PrintWarning(f"[Silhouette] Could not remove old outline '{old_outline.Label}': {e}\n")
+    
+    for container, part_obj in targets:
+        try:
+            # Create silhouette
+            if method == "cross_section":
+                silhouette_face = create_cross_section(part_obj, cut_height)
+            else:
+                silhouette_face = create_silhouette(part_obj)
+            
+            if silhouette_face is None:
+                FreeCAD.Console.PrintWarning(f"[Silhouette] Could not create silhouette for '{container.Label}'\n")
+                continue
+            
+            # Create silhouette object INSIDE the container
+            silhouette_obj = doc.addObject("Part::Feature", f"outline_{container.Label}")
+            silhouette_obj.Shape = silhouette_face
+            
+            # Position at Z=0 with no offset (cross-section already translated)
+            silhouette_obj.Placement = _IDENTITY_PLACEMENT
+            
+            # Style the silhouette
+            if hasattr(silhouette_obj, "ViewObject"):
+                silhouette_obj.ViewObject.ShapeColor = _OUTLINE_COLOR
+                silhouette_obj.ViewObject.Transparency = 50
+                silhouette_obj.ViewObject.LineWidth = 2.0
+            
+            # Add to the container (alongside the part)
+            container.addObject(silhouette_obj)
+            all_silhouettes.append(silhouette_obj)
+            
+        except Exception as e:
+            FreeCAD.Console.PrintError(f"[Silhouette] Error for '{container.Label}': {e}\n")
+            continue
     
     FreeCAD.Console.PrintMessage(f"[Silhouette] Created {len(all_silhouettes)} silhouettes across {len(sheets_processed)} sheets\n")
     
@@ -532,11 +611,11 @@ def create_silhouette_for_container(doc, container, cut_height=None, method="cro
     silhouette_obj.Shape = silhouette_face
     
     # Position at Z=0, no additional offset needed (cross-section is already translated)
-    silhouette_obj.Placement = FreeCAD.Placement()
+    silhouette_obj.Placement = _IDENTITY_PLACEMENT
     
     # Style the silhouette
     if hasattr(silhouette_obj, "ViewObject"):
-        silhouette_obj.ViewObject.ShapeColor = (0.2, 0.6, 1.0)  # Light blue
+        silhouette_obj.ViewObject.ShapeColor = _OUTLINE_COLOR
         silhouette_obj.ViewObject.Transparency = 50
         silhouette_obj.ViewObject.LineWidth = 2.0
     
@@ -581,11 +660,11 @@ def create_silhouette_for_part(doc, part_obj, parent_container=None, cut_height=
     # Create silhouette object
     silhouette_obj = doc.addObject("Part::Feature", f"outline_{part_obj.Label}")
     silhouette_obj.Shape = silhouette_face
-    silhouette_obj.Placement = FreeCAD.Placement()
+    silhouette_obj.Placement = _IDENTITY_PLACEMENT
     
     # Style the silhouette
     if hasattr(silhouette_obj, "ViewObject"):
-        silhouette_obj.ViewObject.ShapeColor = (0.2, 0.6, 1.0)  # Light blue
+        silhouette_obj.ViewObject.ShapeColor = _OUTLINE_COLOR
         silhouette_obj.ViewObject.Transparency = 50
         silhouette_obj.ViewObject.LineWidth = 2.0
     
@@ -6,7 +6,6 @@ finding, stacking, and unstacking the generated sheet layouts.
 """
 
 import FreeCAD
-import ast
 from ...freecad_helpers import get_layout_group, get_sheet_groups, get_all_objects_recursive
 
 class SheetStacker:
@@ -36,22 +35,57 @@ class SheetStacker:
             FreeCAD.Console.PrintError(f"Error reading from spreadsheet: {e}\n")
             return None
 
+    def _collect_layout_objects(self):
+        """
+        Walks the layout group once and returns its leaf objects.
+
+        Returns:
+            tuple: (all_objects, sheet_groups, objects_per_sheet) where
+            objects_per_sheet[i] holds the leaf objects of sheet_groups[i].
+        """
+        sheet_groups = get_sheet_groups(self.layout_group)
+        objects_per_sheet = [
+            get_all_objects_recursive(sheet_group) if sheet_group.isDerivedFrom("App::DocumentObjectGroup") else [sheet_group]
+            for sheet_group in sheet_groups
+        ]
+        all_objects = [obj for sheet_objects in objects_per_sheet for obj in sheet_objects]
+
+        # Pick up anything that lives in the layout outside the sheet groups
+        sheet_names = {sheet_group.Name for sheet_group in sheet_groups}
+        for obj in self.layout_group.Group:
+            if obj.Name in sheet_names:
+                continue
+            if obj.isDerivedFrom("App::DocumentObjectGroup"):
+                all_objects.extend(get_all_objects_recursive(obj))
+            else:
+                all_objects.append(obj)
+        return all_objects, sheet_groups, objects_per_sheet
+
     def toggle_stack(self):
         """Public method to stack or unstack the sheets."""
         if not self.layout_group:
             FreeCAD.Console.PrintMessage("No valid packed layout found to stack/unstack.\n")
             return
         
-        if not hasattr(self.layout_group, "IsStacked"):
-             self.layout_group.addProperty("App::PropertyBool", "IsStacked", "Nesting")
-             self.layout_group.IsStacked = False
-        
-        if self.layout_group.IsStacked:
-            self._unstack()
-        else:
-            self._stack()
-        
-        self.doc.recompute()
+        # Record every placement change as one undo step; the single recompute
+        # at the end picks up all the touched objects together
+        self.doc.openTransaction("Stack/Unstack Sheets")
+        try:
+            if not hasattr(self.layout_group, "IsStacked"):
+                self.layout_group.addProperty("App::PropertyBool", "IsStacked", "Nesting")
+                self.layout_group.IsStacked = False
+            
+            if self.layout_group.IsStacked:
+                self._unstack()
+            else:
+                self._stack()
+            
+            self.doc.recompute()
+        except Exception:
+            # Roll back a half-applied stack/unstack instead of committing it
+            self.doc.abortTransaction()
+            raise
+        self.doc.commitTransaction()
 
     def _stack(self):
         """Moves all objects in sheets 2 and higher to overlay sheet 1."""
@@ -65,20 +99,21 @@ class SheetStacker:
         if not hasattr(self.layout_group, "OriginalPlacements"):
             self.layout_group.addProperty("App::PropertyMap", "OriginalPlacements", "Nesting")
 
+        # One walk of the layout serves both the snapshot and the sheet moves
+        all_objects, sheet_groups, objects_per_sheet = self._collect_layout_objects()
+
         placements_dict = {}
-        all_objects = get_all_objects_recursive(self.layout_group)
         for obj in all_objects:
             if not hasattr(obj, 'Placement'):
                 continue
-            # Store placement as a string representation of a tuple:
-            # (Base.x, Base.y, Base.z, Rotation.Q[0], Rotation.Q[1], Rotation.Q[2], Rotation.Q[3])
+            # Store placement as comma-separated floats:
+            # Base.x,Base.y,Base.z,Rotation.Q[0],Rotation.Q[1],Rotation.Q[2],Rotation.Q[3]
             p = obj.Placement
-            placement_str = str((p.Base.x, p.Base.y, p.Base.z, p.Rotation.Q[0], p.Rotation.Q[1], p.Rotation.Q[2], p.Rotation.Q[3]))
-            placements_dict[obj.Name] = placement_str
+            base = p.Base
+            placements_dict[obj.Name] = ",".join(map(repr, (base.x, base.y, base.z) + tuple(p.Rotation.Q)))
         self.layout_group.OriginalPlacements = placements_dict
 
         total_sheet_width = params["width"] + params["spacing"]
-        sheet_groups = get_sheet_groups(self.layout_group)
 
         if len(sheet_groups) < 2:
             FreeCAD.Console.PrintMessage("Stacking requires two or more sheets.\n")
@@ -89,16 +124,17 @@ class SheetStacker:
         
         # Iterate through all subsequent sheets and move them
         for i in range(1, len(sheet_groups)):
-            sheet_group = sheet_groups[i]
-            
             # The original position of this sheet determines how much it needs to move
             original_pos = FreeCAD.Vector(i * total_sheet_width, 0, 0)
             move_vec = target_pos - original_pos
             
             # Apply this transformation to all objects within this sheet's group
-            objects_to_move = get_all_objects_recursive(sheet_group)
-            for obj in objects_to_move:
-                new_placement = FreeCAD.Placement(move_vec, FreeCAD.Rotation()).multiply(obj.Placement)
+            # The move is a pure translation, so shift each placement's Base in
+            # place instead of composing it with a new Placement per object.
+            # obj.Placement returns a copy, which is assigned back.
+            for obj in objects_per_sheet[i]:
+                new_placement = obj.Placement
+                new_placement.move(move_vec)
                 obj.Placement = new_placement
 
         self.layout_group.IsStacked = True
@@ -118,9 +154,13 @@ class SheetStacker:
             if obj.Name in placements_dict:
                 placement_str = placements_dict[obj.Name]
                 try:
-                    # Use ast.literal_eval for safely evaluating the string representation of the tuple
-                    data = ast.literal_eval(placement_str)
-                except (ValueError, SyntaxError):
+                    # Parse with float() rather than a Python literal parser. Stripping
+                    # the parentheses also reads layouts stacked by older versions,
+                    # which stored the placement as a tuple string.
+                    data = [float(v) for v in placement_str.strip("()").split(",")]
+                    if len(data) != 7:
+                        raise ValueError(placement_str)
+                except ValueError:
                     FreeCAD.Console.PrintWarning(f"Could not parse placement data for '{obj.Name}'. Skipping.\n")
                     continue
                 base = FreeCAD.Vector(data[0], data[1], data[2])
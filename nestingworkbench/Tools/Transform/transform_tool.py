@@ -28,6 +28,7 @@ class TransformToolObserver:
         self.layout_group = None
         self.original_placements = {}
         self.original_visibilities = {}
+        self._drag_targets = {}  # Object Name -> tracked object it drags
         self.callback_ids = []  # Store callback IDs for cleanup
         self.last_log_time = 0
         self.selected_obj = None
@@ -45,66 +46,43 @@ class TransformToolObserver:
             return
 
         # Store original placements and manage visibility
-        # print(f"DEBUG: Traversing Layout Group: {self.layout_group.Label}")
-        for sheet_group in self.layout_group.Group:
-            # print(f"DEBUG: Checking sheet_group: {sheet_group.Label} (Type: {sheet_group.TypeId})")
-            if sheet_group.isDerivedFrom("App::DocumentObjectGroup"):
+        for role, obj in self._walk_layout():
+            view_obj = obj.ViewObject if hasattr(obj, "ViewObject") else None
+
+            if role == "boundary":
                 # Ensure sheet boundary is visible
-                sheet_boundary = next((obj for obj in sheet_group.Group if obj.Label.startswith("Sheet_Boundary_")), None)
-                if sheet_boundary and hasattr(sheet_boundary, "ViewObject"):
-                    self.original_visibilities[sheet_boundary] = sheet_boundary.ViewObject.Visibility
-                    sheet_boundary.ViewObject.Visibility = True
-                
-                # print(f"DEBUG: Sheet Group content count: {len(sheet_group.Group)}")
-                for sub_group in sheet_group.Group: # e.g., Shapes_1, Text_1
-                    # print(f"DEBUG: Checking sub_group: {sub_group.Label} (Type: {sub_group.TypeId})")
-                    if sub_group.isDerivedFrom("App::DocumentObjectGroup"):
-                        if sub_group.Label.startswith("Shapes_"):
-                            # print(f"DEBUG: Found Shapes group: {sub_group.Label}")
-                            for obj in sub_group.Group: # e.g., nested_PartA_1
-                                # print(f"DEBUG: Inspecting obj: {obj.Label} Proxy: {obj.Proxy.__class__.__name__ if hasattr(obj, 'Proxy') else 'None'}")
-                                
-                                has_shape_proxy = hasattr(obj, "Proxy") and isinstance(obj.Proxy, object) and obj.Proxy.__class__.__name__ == "ShapeObject"
-                                # Relaxed check: allow if it has the proxy OR if it's in the Shapes group (likely a nested part without proxy)
-                                if has_shape_proxy or True: 
-                                    # print(f"DEBUG: Tracking ShapeObject: {obj.Label}")
-                                    self.original_placements[obj] = obj.Placement.copy()
-                                    if hasattr(obj, "ViewObject"):
-                                        self.original_visibilities[obj] = obj.ViewObject.Visibility
-                                        
-                                        # Manage visibility of linked objects (BoundaryObject and LabelObject)
-                                        replacement_shown = False
-                                        if hasattr(obj, "BoundaryObject") and obj.BoundaryObject and hasattr(obj.BoundaryObject, "ViewObject"):
-                                            self.original_visibilities[obj.BoundaryObject] = obj.BoundaryObject.ViewObject.Visibility
-                                            obj.BoundaryObject.ViewObject.Visibility = True # Always show bounds in transform mode
-                                            replacement_shown = True
-                                        if hasattr(obj, "LabelObject") and obj.LabelObject and hasattr(obj.LabelObject, "ViewObject"):
-                                            self.original_visibilities[obj.LabelObject] = obj.LabelObject.ViewObject.Visibility
-                                            obj.LabelObject.ViewObject.Visibility = True # Always show label in transform mode
-                                            replacement_shown = True
-                                        
-                                        # Only hide the original 3D shape if we are showing a replacement (Boundary/Label)
-                                        if replacement_shown:
-                                            obj.ViewObject.Visibility = False 
-
-                        elif sub_group.Label.startswith("Text_"):
-                             # print(f"DEBUG: Found Text group: {sub_group.Label}")
-                             for label_obj in sub_group.Group: # e.g., label_unplaced_PartB
-                                if hasattr(label_obj, "Proxy") and isinstance(label_obj.Proxy, object) and label_obj.Proxy.__class__.__name__ == "LabelObject":
-                                    # print(f"DEBUG: Tracking LabelObject: {label_obj.Label}")
-                                    self.original_placements[label_obj] = label_obj.Placement.copy()
-                                    if hasattr(label_obj, "ViewObject"):
-                                        self.original_visibilities[label_obj] = label_obj.ViewObject.Visibility
-                                        label_obj.ViewObject.Visibility = True # Ensure standalone labels are visible
+                if view_obj:
+                    self.original_visibilities[obj] = view_obj.Visibility
+                    view_obj.Visibility = True
+
+            elif role == "shape":
+                self.original_placements[obj] = obj.Placement.copy()
+                if view_obj:
+                    self.original_visibilities[obj] = view_obj.Visibility
+
+                    # Manage visibility of linked objects (BoundaryObject and LabelObject)
+                    replacement_shown = False
+                    for linked in (getattr(obj, "BoundaryObject", None), getattr(obj, "LabelObject", None)):
+                        if linked and hasattr(linked, "ViewObject"):
+                            self.original_visibilities[linked] = linked.ViewObject.Visibility
+                            linked.ViewObject.Visibility = True # Always show bounds and label in transform mode
+                            replacement_shown = True
+
+                    # Only hide the original 3D shape if we are showing a replacement (Boundary/Label)
+                    if replacement_shown:
+                        view_obj.Visibility = False
+
+            elif role == "label":
+                self.original_placements[obj] = obj.Placement.copy()
+                if view_obj:
+                    self.original_visibilities[obj] = view_obj.Visibility
+                    view_obj.Visibility = True # Ensure standalone labels are visible
+
+        self._build_drag_index()
 
         # After changing visibilities, we need to update the GUI to reflect them.
         FreeCADGui.updateGui()
 
-        # Debug: list tracked objects
-        print("DEBUG: Tracked objects in original_placements:")
-        for obj in self.original_placements:
-           print(f"  - {obj.Label if hasattr(obj, 'Label') else obj} (Name: {obj.Name if hasattr(obj, 'Name') else 'No Name'})")
-
         # Register event callbacks for mouse interaction
         if self.layout_group:
             cb_id = self.view.addEventCallback("SoMouseButtonEvent", self._make_callback("SoMouseButtonEvent"))
@@ -116,6 +94,38 @@ class TransformToolObserver:
             FreeCAD.Console.PrintMessage("Transform Tool: Activated. Click and drag parts to move them.\n")
 
 
+    def _walk_layout(self):
+        """
+        Walks the layout group in one pass and yields (role, obj) pairs, where
+        role is "boundary" for a sheet boundary, "shape" for an object in a
+        Shapes_ group and "label" for a LabelObject in a Text_ group.
+        Each Label is read once and the group type is checked once per node.
+        """
+        for sheet_group in self.layout_group.Group:
+            if not sheet_group.isDerivedFrom("App::DocumentObjectGroup"):
+                continue
+
+            boundary_found = False
+            for child in sheet_group.Group: # e.g., Sheet_Boundary_1, Shapes_1, Text_1
+                label = child.Label
+                if not boundary_found and label.startswith("Sheet_Boundary_"):
+                    boundary_found = True
+                    yield "boundary", child
+                    continue
+                if not child.isDerivedFrom("App::DocumentObjectGroup"):
+                    continue
+
+                if label.startswith("Shapes_"):
+                    # Every object in a Shapes group is draggable, whether or not
+                    # it carries a ShapeObject proxy (e.g. nested_PartA_1)
+                    for obj in child.Group:
+                        yield "shape", obj
+                elif label.startswith("Text_"):
+                    for label_obj in child.Group: # e.g., label_unplaced_PartB
+                        proxy = getattr(label_obj, "Proxy", None)
+                        if proxy.__class__.__name__ == "LabelObject":
+                            yield "label", label_obj
+
     def eventCallback(self, event_type, event_dict):
         """The main callback method for handling mouse and keyboard events."""
         try:
@@ -320,6 +330,39 @@ class TransformToolObserver:
             return self.eventCallback(event_type, event_dict)
         return callback
 
+    def _build_drag_index(self):
+        """
+        Maps the Name of everything that can be clicked to the tracked object it
+        drags, so get_draggable_parent is a dict lookup rather than a scan of all
+        tracked objects. Entries are written from the weakest match to the
+        strongest, so a stronger match overwrites a weaker one.
+        """
+        index = {}
+        tracked_objs = list(self.original_placements.keys())
+
+        # Linked objects and group children (App::Part containers). Iterate in
+        # reverse so the first tracked object wins, as in the old scan.
+        for tracked_obj in reversed(tracked_objs):
+            if hasattr(tracked_obj, "Group"):
+                for child in tracked_obj.Group:
+                    index[child.Name] = tracked_obj
+            linked = getattr(tracked_obj, "LinkedObject", None)
+            if linked is not None:
+                index[linked.Name] = tracked_obj
+
+        # Tracked objects themselves
+        for tracked_obj in tracked_objs:
+            index[tracked_obj.Name] = tracked_obj
+
+        # Boundary and label objects linked to a ShapeObject drag that ShapeObject
+        for tracked_obj in reversed(tracked_objs):
+            if hasattr(tracked_obj, "Proxy") and tracked_obj.Proxy.__class__.__name__ == "ShapeObject":
+                for linked in (getattr(tracked_obj, "BoundaryObject", None), getattr(tracked_obj, "LabelObject", None)):
+                    if linked:
+                        index[linked.Name] = tracked_obj
+
+        self._drag_targets = index
+
     def get_draggable_parent(self, obj, parent_obj_from_click=None):
         """
         Determines the actual object to drag based on what was clicked.
@@ -328,45 +371,16 @@ class TransformToolObserver:
         2. Linked object matching (App::Link).
         3. Parent containment matching (App::Part containing clicked object).
         4. Matching via 'ParentObject' from click info.
-        """        
-        # Check if the clicked object is a linked boundary or label of a ShapeObject
-        for potential_parent_shape_obj in self.original_placements.keys():
-            if hasattr(potential_parent_shape_obj, "Proxy") and isinstance(potential_parent_shape_obj.Proxy, object) and potential_parent_shape_obj.Proxy.__class__.__name__ == "ShapeObject":
-                if hasattr(potential_parent_shape_obj, "BoundaryObject") and potential_parent_shape_obj.BoundaryObject == obj:
-                    return potential_parent_shape_obj # Drag the ShapeObject parent
-                if hasattr(potential_parent_shape_obj, "LabelObject") and potential_parent_shape_obj.LabelObject == obj:
-                    return potential_parent_shape_obj # Drag the ShapeObject parent
-        
-        # Check if the clicked object itself is tracked
-        if obj in self.original_placements:
-            return obj
-
-        # Check against tracked objects with advanced logic
-        for tracked_obj in self.original_placements.keys():
-            if tracked_obj == obj:
-                 return tracked_obj
-            
-            # LINK MATCHing
-            if hasattr(tracked_obj, "LinkedObject") and tracked_obj.LinkedObject == obj:
-                # print(f"DEBUG: Matched via LinkedObject: {tracked_obj.Label} -> {obj.Label}")
-                return tracked_obj
-
-            # PARENT CONTAINMENT MATCHING (For App::Part)
-            # Check if clicked object is inside tracked_obj's Group
-            if hasattr(tracked_obj, "Group") and obj in tracked_obj.Group:
-                 # print(f"DEBUG: Matched via Group Containment: {tracked_obj.Label} contains {obj.Label}")
-                 return tracked_obj
-            
-            # PARENT OBJECT FROM CLICK INFO MATCHING
-            if parent_obj_from_click and tracked_obj == parent_obj_from_click:
-                 # print(f"DEBUG: Matched via ParentObject info: {tracked_obj.Label}")
-                 return tracked_obj
-
-            # NAME MATCHING (Fallback)
-            if hasattr(tracked_obj, 'Name') and hasattr(obj, 'Name') and tracked_obj.Name == obj.Name:
-                # print(f"DEBUG: Matched by Name: {tracked_obj.Name}")
-                return tracked_obj
-        
+        """
+        # Cases 1-3 (and the old Name fallback) are precomputed in _drag_targets
+        target = self._drag_targets.get(getattr(obj, "Name", None))
+        if target is not None:
+            return target
+
+        # Case 4: the click info names a tracked parent object directly
+        if parent_obj_from_click is not None and parent_obj_from_click in self.original_placements:
+            return parent_obj_from_click
+
         return None
 
     def is_object_in_layout(self, obj):
@@ -410,6 +424,7 @@ class TransformToolObserver:
         self.callback_ids = []
         
         self.original_placements = {}
+        self._drag_targets = {}
         # Restore original visibility
         for obj, is_visible in self.original_visibilities.items():
             try:
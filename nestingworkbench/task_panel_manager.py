@@ -19,15 +19,15 @@ class NestingTaskPanel:
     
     def accept(self):
         """Called by FreeCAD when the dialog's 'OK' button is clicked."""
-        if hasattr(self.form, "accept"):
-            self.form.accept()
+        if hasattr(self.form, "accept") and self.form.accept() is False:
+            return False # A job is still running, keep the dialog open
         self.cleanup()
         return True
 
     def reject(self):
         """Called by FreeCAD when the dialog is closed or 'Cancel' is clicked."""
-        if hasattr(self.form, "reject"):
-            self.form.reject()
+        if hasattr(self.form, "reject") and self.form.reject() is False:
+            return False # A job is still running, keep the dialog open
         self.cleanup()
         return True
 